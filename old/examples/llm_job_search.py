@@ -73,7 +73,7 @@ async def find_llm_jobs_and_store():
         
         # Show top jobs
         print(f"\n🏆 Top 5 LLM Engineering Jobs:")
-        for i, job in enumerate(jobs[:5], 1):
+        for i, job in enumerate(results["top_jobs"], 1):
             salary_str = f"${job.salary_min:,}-${job.salary_max:,}" if job.salary_min and job.salary_max else "Salary TBD"
             print(f"   {i}. {job.title}")
             print(f"      🏢 {job.company} | 💰 {salary_str}")
@@ -221,7 +221,7 @@ def show_implementation_guide():
         "   • Create LLM-optimized filters",
         "",
         "2. 🔧 Add to multi-site scraper:",
-        "   • Add scraper to self.scrapers dict",
+        "   • Add scraper class to _SCRAPER_CLASSES",
         "   • Configure in self.site_configs",
         "   • Set priority and expected results",
         "",
@@ -23,7 +23,7 @@ class RemoteType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobListing:
     """Comprehensive job listing data structure."""
     # Basic Information
@@ -3,24 +3,104 @@ Indeed-specific LLM Engineer scraper.
 Optimized for Indeed's high job volume with anti-detection measures.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterator, List, Optional, Dict, Any, Set, Tuple
 import asyncio
 import re
-import random
-from urllib.parse import urlencode
-from datetime import datetime
+import functools
+import hashlib
+import sqlite3
+from pathlib import Path
+from urllib.parse import urlencode, urljoin
+from datetime import datetime, timedelta
+
+from playwright.async_api import Error as PlaywrightError, Page
 
 from .playwright_scraper import PlaywrightJobScraper  
 from .smart_job_filter import SmartJobFilter, JobFilter
 from ..models.job_models import JobListing, JobType, RemoteType
 
 
+# Salary parsing patterns, compiled once for all cards
+_SALARY_STRIP_TABLE = str.maketrans('', '', '$,')
+_SALARY_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+_SALARY_SINGLE_RE = re.compile(r'(\d+)')
+
+# Jobs returned by a run are skipped by later runs for this many days (needs db_path)
+SEEN_JOBS_WINDOW_DAYS = 7
+
+# Hourly rates are annualized assuming 40 hours/week, 52 weeks/year
+HOURLY_SCALE = 40 * 52
+# Salaries below this are taken to be hourly rates
+HOURLY_THRESHOLD = 200
+
+
+# Indeed job selectors (updated for current Indeed layout)
+_JOB_CARD_SELECTOR = 'div[data-jk], .job_seen_beacon, .jobsearch-SerpJobCard, [data-testid="job-result"]'
+
+# Extracts the fields of the first `limit` distinct job cards in a single evaluate call.
+# Nested elements can match more than one card selector, so cards are
+# deduplicated in the browser by their Indeed job key (data-jk) or link.
+_EXTRACT_CARDS_JS = """
+({selector, limit}) => {
+    const text = (card, sel) => {
+        const el = card.querySelector(sel);
+        return el ? el.innerText : null;
+    };
+    const seen = new Set();
+    const out = [];
+    for (const card of document.querySelectorAll(selector)) {
+        const link = card.querySelector('h2 a, .jobTitle a');
+        const href = link ? link.getAttribute('href') : null;
+        const keyed = card.matches('[data-jk]') ? card : card.querySelector('[data-jk]');
+        const jk = keyed ? keyed.getAttribute('data-jk') : null;
+        const id = jk || href;
+        if (id) {
+            if (seen.has(id)) continue;
+            seen.add(id);
+        }
+        out.push({
+            jk: jk,
+            title: text(card, 'h2 a span, .jobTitle a span, [data-testid="job-title"]'),
+            company: text(card, '.companyName, [data-testid="company-name"]'),
+            location: text(card, '.companyLocation, [data-testid="job-location"]'),
+            url: href,
+            salary: text(card, '.salary-snippet, [data-testid="job-salary"]'),
+            description: text(card, '.job-snippet, [data-testid="job-snippet"]'),
+        });
+        if (out.length >= limit) break;
+    }
+    return out;
+}
+"""
+
+
 class IndeedLLMScraper(PlaywrightJobScraper):
     """Indeed-specific scraper for LLM Engineer positions."""
     
-    def __init__(self, headless: bool = True, strict_mode: bool = False):
-        """Initialize Indeed LLM scraper."""
-        super().__init__(headless=headless, slow_mo=800)
+    # Queries run concurrently, each in its own browser context
+    MAX_PARALLEL_PAGES = 3
+    
+    # LLM-specific search queries for Indeed
+    LLM_QUERIES = [
+        "LLM Engineer",
+        "Large Language Model Engineer", 
+        "Machine Learning Engineer AI",
+        "AI Engineer",
+        "ML Engineer"
+    ]
+    
+    
+    def __init__(self, headless: bool = True, strict_mode: bool = False,
+                 user_data_dir: Optional[Path] = None, db_path: Optional[Path] = None):
+        """Initialize Indeed LLM scraper.
+        
+        Pass `user_data_dir` to keep Indeed's cookies (consent banner,
+        anti-bot tokens) in a persistent profile between runs.
+        
+        Pass `db_path` to record the jobs each run returns in a SQLite
+        database, so runs within SEEN_JOBS_WINDOW_DAYS skip them.
+        """
+        super().__init__(headless=headless, slow_mo=800, user_data_dir=user_data_dir)
         self.base_url = "https://www.indeed.com"
         self.source_name = "indeed"
         self.strict_mode = strict_mode
@@ -30,10 +110,18 @@ class IndeedLLMScraper(PlaywrightJobScraper):
         self.smart_filter = SmartJobFilter(self.job_filter)
         
         # Rate limiting parameters
-        self.min_delay = 3.0
-        self.max_delay = 8.0
+        self.min_delay = 1.0
+        self.max_delay = 2.0
+        self.navigation_timeout = 15000
         self.requests_count = 0
         self.max_requests_per_session = 15
+        
+        # Search URLs already fetched in the current run (reset by iter_llm_jobs)
+        self._visited_urls: Set[str] = set()
+        
+        # Optional record of scraped job keys for incremental runs (opened lazily)
+        self.db_path = Path(db_path) if db_path else None
+        self._db: Optional[sqlite3.Connection] = None
     
     def _create_indeed_llm_filter(self, strict_mode: bool) -> JobFilter:
         """Create Indeed-optimized LLM filter."""
@@ -78,52 +166,8 @@ class IndeedLLMScraper(PlaywrightJobScraper):
         print(f"📍 Location: {location}")
         print(f"📄 Max pages: {max_pages}")
         
-        all_jobs = []
-        
-        # LLM-specific search queries for Indeed
-        queries = [
-            "LLM Engineer",
-            "Large Language Model Engineer", 
-            "Machine Learning Engineer AI",
-            "AI Engineer",
-            "ML Engineer"
-        ]
-        
         try:
-            # Use async context to ensure proper browser management
-            async with self:
-                for query in queries[:3]:  # Limit to top 3 queries
-                    print(f"🔍 Searching Indeed for: '{query}'")
-                    
-                    # Build Indeed search URL
-                    search_url = self._build_indeed_search_url(query, location)
-                    print(f"   Navigating to: {search_url}")
-                    
-                    # Navigate to search results
-                    if not await self.safe_navigate(search_url):
-                        print(f"   ❌ Failed to navigate to Indeed")
-                        continue
-                    
-                    # Extract jobs from current page
-                    page_jobs = await self._extract_indeed_jobs()
-                    
-                    if page_jobs:
-                        # Apply smart filtering
-                        filtered_jobs = self.smart_filter.filter_jobs(page_jobs, verbose=False)
-                        all_jobs.extend(filtered_jobs)
-                        print(f"   ✅ Found {len(page_jobs)} jobs, kept {len(filtered_jobs)} after filtering")
-                    else:
-                        print(f"   ⚠️ No jobs found for '{query}'")
-                    
-                    # Delay between searches
-                    await self.random_delay(self.min_delay, self.max_delay)
-                    
-                    # Respect rate limiting
-                    self.requests_count += 1
-                    if self.requests_count >= self.max_requests_per_session:
-                        print(f"   ⏸️ Rate limit reached, stopping searches")
-                        break
-                        
+            all_jobs = [job async for job in self.iter_llm_jobs(location)]
         except Exception as e:
             print(f"❌ Indeed search error: {e}")
             return {
@@ -148,10 +192,128 @@ class IndeedLLMScraper(PlaywrightJobScraper):
             ]
         }
     
-    def _build_indeed_search_url(self, query: str, location: str) -> str:
-        """Build Indeed search URL with proper parameters."""
-        import urllib.parse
+    async def close(self):
+        """Close the seen-jobs database, then the browser (or our context on a shared one)."""
+        if self._db:
+            self._db.close()
+            self._db = None
+        await super().close()
+    
+    async def iter_llm_jobs(self, location: str = "Houston, TX") -> AsyncIterator[JobListing]:
+        """
+        Yield filtered Indeed LLM jobs as soon as each query finishes.
         
+        Queries run concurrently; closing the generator early cancels the
+        ones still in flight and closes the browser.
+        """
+        # Use async context to ensure proper browser management
+        async with self:
+            # Each run is one session; later searches by a cached scraper fetch again
+            self._visited_urls.clear()
+            if self.user_data_dir:
+                # Queries share the persistent profile's single context
+                await self.block_heavy_resources(self.context)
+            semaphore = asyncio.Semaphore(self.MAX_PARALLEL_PAGES)
+            # Postings already seen by any query, so overlaps aren't filtered twice
+            seen: Set[str] = set()
+            # Jobs handed to the caller; only these are recorded for later runs
+            returned: List[JobListing] = []
+            
+            async def run_bounded(query: str) -> List[JobListing]:
+                async with semaphore:
+                    return await self._run_one_query(query, location, seen)
+            
+            # Limit to top 3 queries, searched concurrently
+            tasks = [asyncio.create_task(run_bounded(query)) for query in self.LLM_QUERIES[:3]]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    for job in await next_done:
+                        returned.append(job)
+                        yield job
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if self.db_path:
+                    self._record_returned_jobs(returned)
+    
+    async def _run_one_query(self, query: str, location: str, seen: Set[str]) -> List[JobListing]:
+        """Search one query in its own browser context and return filtered jobs."""
+        # Build Indeed search URL, skipping ones already fetched this session
+        search_url = self._build_indeed_search_url(query, location)
+        if search_url in self._visited_urls:
+            print(f"   ♻️ Already searched '{query}' this session")
+            return []
+        
+        # Respect rate limiting
+        if self.requests_count >= self.max_requests_per_session:
+            print(f"   ⏸️ Rate limit reached, skipping '{query}'")
+            return []
+        self.requests_count += 1
+        self._visited_urls.add(search_url)
+        
+        print(f"🔍 Searching Indeed for: '{query}'")
+        if self.user_data_dir:
+            context = self.context
+        else:
+            context = await self.new_context()
+            await self.block_heavy_resources(context)
+        page = await context.new_page()
+        try:
+            
+            print(f"   Navigating to: {search_url}")
+            
+            # Navigate to search results
+            if not await self.safe_navigate(search_url, page=page, timeout=self.navigation_timeout):
+                print(f"   ❌ Failed to navigate to Indeed")
+                return []
+            
+            # Extract jobs from current page
+            page_jobs = await self._extract_indeed_jobs(page)
+            
+            # Drop postings another query already returned
+            found_count = len(page_jobs)
+            page_jobs = self._drop_seen_jobs(page_jobs, seen)
+            if len(page_jobs) < found_count:
+                print(f"   ♻️ Skipped {found_count - len(page_jobs)} jobs already found by another query")
+            
+            filtered_jobs = []
+            if page_jobs:
+                # Apply smart filtering off the event loop so other queries keep running
+                filtered_jobs = await asyncio.to_thread(self.smart_filter.filter_jobs, page_jobs, False)
+                print(f"   ✅ Found {len(page_jobs)} jobs, kept {len(filtered_jobs)} after filtering")
+            else:
+                print(f"   ⚠️ No jobs found for '{query}'")
+            
+            # Delay before releasing the slot to the next search
+            await self.random_delay(self.min_delay, self.max_delay)
+            
+            return filtered_jobs
+        finally:
+            await page.close()
+            if context is not self.context:
+                await context.close()
+    
+    @staticmethod
+    def _job_key(job: JobListing) -> str:
+        """Key identifying a posting across queries (company, title and snippet hash)."""
+        digest = hashlib.sha1(job.description.encode("utf-8")).hexdigest()
+        return f"{job.company.lower()}|{job.title.lower()}|{digest}"
+    
+    def _drop_seen_jobs(self, jobs: List[JobListing], seen: Set[str]) -> List[JobListing]:
+        """Return jobs whose key isn't in `seen`, recording the new keys."""
+        unique_jobs = []
+        for job in jobs:
+            key = self._job_key(job)
+            if key not in seen:
+                seen.add(key)
+                unique_jobs.append(job)
+        return unique_jobs
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_indeed_search_url(query: str, location: str) -> str:
+        """Build Indeed search URL with proper parameters."""
         base_url = "https://www.indeed.com/jobs"
         params = {
             "q": query,
@@ -163,147 +325,157 @@ class IndeedLLMScraper(PlaywrightJobScraper):
         }
         
         # Add query parameters
-        query_string = urllib.parse.urlencode(params)
+        query_string = urlencode(params)
         return f"{base_url}?{query_string}"
     
-    async def _extract_indeed_jobs(self) -> List:
+    async def _extract_indeed_jobs(self, page: Optional[Page] = None) -> List:
         """Extract job listings from Indeed search results page."""
-        jobs = []
+        page = page or self.page
         
         try:
             # Wait for page to load
-            await self.page.wait_for_timeout(2000)
-            
-            # Indeed job selectors (updated for current Indeed layout)
-            job_cards = await self.page.query_selector_all(
-                'div[data-jk], .job_seen_beacon, .jobsearch-SerpJobCard, [data-testid="job-result"]'
-            )
-            
-            print(f"   📋 Found {len(job_cards)} job cards on Indeed")
+            await page.wait_for_timeout(2000)
             
-            for card in job_cards[:20]:  # Limit to first 20 jobs per page
-                try:
-                    job = await self._extract_single_indeed_job(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"   ⚠️ Error extracting job: {e}")
-                    continue
-                    
-        except Exception as e:
+            # Read every card's fields in one round-trip to the browser
+            cards = await page.evaluate(_EXTRACT_CARDS_JS, {"selector": _JOB_CARD_SELECTOR, "limit": 20})
+        except PlaywrightError as e:
             print(f"   ❌ Error extracting Indeed jobs: {e}")
-            
+            return []
+        
+        print(f"   📋 Found {len(cards)} unique job cards on Indeed")
+        
+        if self.db_path:
+            # Skip postings returned by a recent earlier run (this run records at the end)
+            known = self._known_job_keys([card["jk"] for card in cards if card.get("jk")])
+            if known:
+                cards = [card for card in cards if card.get("jk") not in known]
+                print(f"   ♻️ Skipped {len(known)} jobs returned by runs in the last {SEEN_JOBS_WINDOW_DAYS} days")
+        
+        # One timestamp for every card on the page
+        now = datetime.now()
+        jobs = []
+        for card in cards:
+            job = self._extract_single_indeed_job(card, now)
+            if job:
+                jobs.append(job)
+        
         return jobs
     
-    async def _extract_single_indeed_job(self, card) -> Optional:
-        """Extract a single job from Indeed job card."""
-        from ..models.job_models import JobListing, JobType, RemoteType
-        from datetime import datetime
-        
-        try:
-            # Extract title
-            title_elem = await card.query_selector('h2 a span, .jobTitle a span, [data-testid="job-title"]')
-            title = await title_elem.inner_text() if title_elem else "Unknown Title"
-            
-            # Extract company
-            company_elem = await card.query_selector('.companyName, [data-testid="company-name"]')
-            company = await company_elem.inner_text() if company_elem else "Unknown Company"
-            
-            # Extract location
-            location_elem = await card.query_selector('.companyLocation, [data-testid="job-location"]')
-            location = await location_elem.inner_text() if location_elem else "Unknown Location"
-            
-            # Extract URL
-            link_elem = await card.query_selector('h2 a, .jobTitle a')
-            if link_elem:
-                relative_url = await link_elem.get_attribute('href')
-                url = f"https://www.indeed.com{relative_url}" if relative_url else ""
-            else:
-                url = ""
-            
-            # Extract salary (if available)
-            salary_elem = await card.query_selector('.salary-snippet, [data-testid="job-salary"]')
-            salary_text = await salary_elem.inner_text() if salary_elem else ""
-            
-            # Parse salary
-            salary_min, salary_max = self._parse_indeed_salary(salary_text)
-            
-            # Extract snippet/description
-            snippet_elem = await card.query_selector('.job-snippet, [data-testid="job-snippet"]')
-            description = await snippet_elem.inner_text() if snippet_elem else ""
-            
-            # Determine remote type
-            remote_type = RemoteType.UNKNOWN
-            location_lower = location.lower()
-            if "remote" in location_lower:
-                remote_type = RemoteType.REMOTE
-            elif "hybrid" in location_lower:
-                remote_type = RemoteType.HYBRID
-            else:
-                remote_type = RemoteType.ONSITE
-            
-            # Create job listing
-            job = JobListing(
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
-                url=url,
-                description=description.strip(),
-                salary_min=salary_min,
-                salary_max=salary_max,
-                job_type=JobType.FULL_TIME,  # Indeed defaults to full-time
-                remote_type=remote_type,
-                source="indeed",
-                posted_date=datetime.now(),
-                scraped_date=datetime.now()
+    def _get_db(self) -> sqlite3.Connection:
+        """Open the seen-jobs database in WAL mode, creating the table if needed."""
+        if self._db is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.db_path), isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS indeed_jobs ("
+                "jk TEXT PRIMARY KEY, url TEXT, title TEXT, company TEXT, first_seen TEXT)"
             )
-            
-            return job
-            
-        except Exception as e:
-            print(f"   ⚠️ Error extracting single Indeed job: {e}")
-            return None
+        return self._db
+    
+    def _known_job_keys(self, keys: List[str]) -> Set[str]:
+        """Return the Indeed job keys (data-jk) returned by runs within SEEN_JOBS_WINDOW_DAYS."""
+        if not keys:
+            return set()
+        cutoff = (datetime.now() - timedelta(days=SEEN_JOBS_WINDOW_DAYS)).isoformat()
+        placeholders = ",".join("?" * len(keys))
+        rows = self._get_db().execute(
+            f"SELECT jk FROM indeed_jobs WHERE first_seen >= ? AND jk IN ({placeholders})",
+            [cutoff, *keys]
+        )
+        return {row[0] for row in rows}
+    
+    def _record_returned_jobs(self, jobs: List[JobListing]):
+        """Record the jobs a run returned so runs within the window skip them."""
+        first_seen = datetime.now().isoformat()
+        self._get_db().executemany(
+            "INSERT OR REPLACE INTO indeed_jobs (jk, url, title, company, first_seen) VALUES (?, ?, ?, ?, ?)",
+            [
+                (job.job_id, job.url, job.title, job.company, first_seen)
+                for job in jobs if job.job_id
+            ]
+        )
     
-    def _parse_indeed_salary(self, salary_text: str) -> tuple[Optional[int], Optional[int]]:
-        """Parse Indeed salary string into min/max values."""
-        import re
+    def _extract_single_indeed_job(self, card: Dict[str, str], now: datetime) -> Optional[JobListing]:
+        """Build a job listing from the fields extracted from an Indeed job card.
+        
+        Returns None for cards without a title (e.g. when Indeed's markup changes).
+        """
+        title = card.get("title")
+        if not title:
+            return None
+        
+        company = card.get("company") or "Unknown Company"
+        location = card.get("location") or "Unknown Location"
+        description = card.get("description") or ""
+        
+        # Extract URL
+        relative_url = card.get("url")
+        # urljoin also copes with links Indeed already returns as absolute
+        url = urljoin(self.base_url, relative_url) if relative_url else ""
+        
+        # Parse salary
+        salary_min, salary_max = self._parse_indeed_salary(card.get("salary") or "")
         
+        # Determine remote type
+        location_lower = location.lower()
+        if "remote" in location_lower:
+            remote_type = RemoteType.REMOTE
+        elif "hybrid" in location_lower:
+            remote_type = RemoteType.HYBRID
+        else:
+            remote_type = RemoteType.ONSITE
+        
+        # Create job listing
+        return JobListing(
+            title=title.strip(),
+            company=company.strip(),
+            location=location.strip(),
+            url=url,
+            description=description.strip(),
+            salary_min=salary_min,
+            salary_max=salary_max,
+            job_type=JobType.FULL_TIME,  # Indeed defaults to full-time
+            remote_type=remote_type,
+            source="indeed",
+            job_id=card.get("jk"),
+            posted_date=now,
+            scraped_date=now
+        )
+    
+    def _parse_indeed_salary(self, salary_text: str) -> Tuple[Optional[int], Optional[int]]:
+        """Parse Indeed salary string into annual min/max values."""
         if not salary_text:
             return None, None
-            
-        # Remove common prefixes/suffixes
-        salary_text = salary_text.replace('$', '').replace(',', '').replace('a year', '').replace('an hour', '')
         
-        # Look for range (e.g., "80000 - 120000")
-        range_match = re.search(r'(\d+)\s*-\s*(\d+)', salary_text)
+        # Remove currency symbols and thousands separators in one pass
+        # ("a year"/"an hour" suffixes don't affect the digit patterns)
+        salary_text = salary_text.translate(_SALARY_STRIP_TABLE)
+        
+        # Look for range (e.g., "80000 - 120000"), then a single value
+        range_match = _SALARY_RANGE_RE.search(salary_text)
         if range_match:
-            min_sal = int(range_match.group(1))
-            max_sal = int(range_match.group(2))
-            
-            # Convert hourly to annual (assume 40 hours/week, 52 weeks/year)
-            if min_sal < 200:  # Likely hourly
-                min_sal *= 40 * 52
-                max_sal *= 40 * 52
-                
-            return min_sal, max_sal
+            min_sal, max_sal = int(range_match.group(1)), int(range_match.group(2))
+        else:
+            single_match = _SALARY_SINGLE_RE.search(salary_text)
+            if not single_match:
+                return None, None
+            min_sal = max_sal = int(single_match.group(1))
         
-        # Look for single value
-        single_match = re.search(r'(\d+)', salary_text)
-        if single_match:
-            salary = int(single_match.group(1))
-            
-            # Convert hourly to annual
-            if salary < 200:  # Likely hourly
-                salary *= 40 * 52
-                
-            return salary, salary
-            
-        return None, None
+        # Convert hourly to annual
+        if min_sal < HOURLY_THRESHOLD:
+            min_sal *= HOURLY_SCALE
+            max_sal *= HOURLY_SCALE
+        
+        return min_sal, max_sal
 
 
-def create_indeed_llm_scraper(strict_mode: bool = False, headless: bool = True) -> IndeedLLMScraper:
+def create_indeed_llm_scraper(strict_mode: bool = False, headless: bool = True,
+                              user_data_dir: Optional[Path] = None,
+                              db_path: Optional[Path] = None) -> IndeedLLMScraper:
     """Create an Indeed LLM scraper."""
-    return IndeedLLMScraper(headless=headless, strict_mode=strict_mode)
+    return IndeedLLMScraper(headless=headless, strict_mode=strict_mode,
+                            user_data_dir=user_data_dir, db_path=db_path)
 
 
 async def test_indeed_scraper():
@@ -314,8 +486,8 @@ async def test_indeed_scraper():
     results = await scraper.search_llm_jobs("Houston, TX", max_pages=1)
     
     print(f"Status: {results['status']}")
-    print(f"Message: {results['message']}")
-    print(f"Expected performance: {results['expected_performance']}")
+    print(f"Message: {results.get('message', results.get('error'))}")
+    print(f"Jobs found: {results['total_jobs_found']}")
 
 
 if __name__ == "__main__":
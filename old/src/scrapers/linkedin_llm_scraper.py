@@ -4,6 +4,7 @@ LinkedIn-specific LLM Engineer scraper.
 
 from typing import List, Optional, Dict, Any, Tuple
 import asyncio
+import functools
 import re
 import random
 from urllib.parse import urlencode
@@ -14,18 +15,77 @@ from .smart_job_filter import SmartJobFilter, JobFilter
 from ..models.job_models import JobListing, JobType, RemoteType
 
 
+# Keyword lists for the LinkedIn LLM filter (compiled once per filter by SmartJobFilter)
+_REQUIRED_KEYWORDS = (
+    "llm", "large language model", "machine learning", "ai engineer",
+    "artificial intelligence", "deep learning", "neural network",
+    "ml engineer", "mlops", "data scientist", "ai researcher",
+    "python", "tensorflow", "pytorch", "transformers",
+    "huggingface", "langchain", "openai", "anthropic",
+    "gpt", "bert", "transformer", "nlp", "computer vision"
+)
+
+_EXCLUDE_KEYWORDS = (
+    "sales", "marketing", "business development", "account manager",
+    "customer success", "recruiting", "hr", "finance"
+)
+
+# LLM-specific search queries for LinkedIn
+_LINKEDIN_QUERIES = (
+    "LLM Engineer",
+    "Large Language Model",
+    "Machine Learning Engineer",
+    "AI Engineer"
+)
+
+# Static part of every search result (shared, read-only)
+_SITE_SPECIFIC_FEATURES = (
+    "Professional network jobs",
+    "Company insights",
+    "Network-based discovery",
+    "Premium role filtering"
+)
+
+
+@functools.lru_cache(maxsize=2)
+def _build_linkedin_llm_filter(strict_mode: bool) -> JobFilter:
+    """Create LinkedIn-optimized LLM filter (built once per mode and shared)."""
+    required_keywords = _REQUIRED_KEYWORDS
+    exclude_keywords = _EXCLUDE_KEYWORDS
+    
+    if strict_mode:
+        return JobFilter(
+            required_keywords=required_keywords,
+            exclude_keywords=exclude_keywords,
+            min_quality_score=0.8,
+            min_salary=130000,
+            allowed_job_types=(JobType.FULL_TIME,),
+            min_description_length=250
+        )
+    else:
+        return JobFilter(
+            required_keywords=required_keywords,
+            exclude_keywords=exclude_keywords,
+            min_quality_score=0.7,
+            min_salary=100000,
+            allowed_job_types=(JobType.FULL_TIME, JobType.CONTRACT),
+            min_description_length=200
+        )
+
+
 class LinkedInLLMScraper(PlaywrightJobScraper):
     """LinkedIn-specific scraper for LLM Engineer positions."""
     
-    def __init__(self, headless: bool = True, strict_mode: bool = False):
-        """Initialize LinkedIn LLM scraper."""
+    def __init__(self, headless: bool = True, strict_mode: bool = False, verbose: bool = True):
+        """Initialize LinkedIn LLM scraper (verbose=False keeps only error output)."""
         super().__init__(headless=headless, slow_mo=600)
         self.base_url = "https://www.linkedin.com"
         self.source_name = "linkedin"
         self.strict_mode = strict_mode
+        self.verbose = verbose
         
         # Create LLM-specific filter for LinkedIn
-        self.job_filter = self._create_linkedin_llm_filter(strict_mode)
+        self.job_filter = _build_linkedin_llm_filter(strict_mode)
         self.smart_filter = SmartJobFilter(self.job_filter)
         
         # LinkedIn-specific settings
@@ -34,71 +94,29 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
         self.requests_count = 0
         self.max_requests_per_session = 10  # Conservative for LinkedIn
     
-    def _create_linkedin_llm_filter(self, strict_mode: bool) -> JobFilter:
-        """Create LinkedIn-optimized LLM filter."""
-        required_keywords = [
-            "llm", "large language model", "machine learning", "ai engineer",
-            "artificial intelligence", "deep learning", "neural network",
-            "ml engineer", "mlops", "data scientist", "ai researcher",
-            "python", "tensorflow", "pytorch", "transformers",
-            "huggingface", "langchain", "openai", "anthropic",
-            "gpt", "bert", "transformer", "nlp", "computer vision"
-        ]
-        
-        exclude_keywords = [
-            "sales", "marketing", "business development", "account manager",
-            "customer success", "recruiting", "hr", "finance"
-        ]
-        
-        if strict_mode:
-            return JobFilter(
-                required_keywords=required_keywords,
-                exclude_keywords=exclude_keywords,
-                min_quality_score=0.8,
-                min_salary=130000,
-                allowed_job_types=[JobType.FULL_TIME],
-                min_description_length=250
-            )
-        else:
-            return JobFilter(
-                required_keywords=required_keywords,
-                exclude_keywords=exclude_keywords,
-                min_quality_score=0.7,
-                min_salary=100000,
-                allowed_job_types=[JobType.FULL_TIME, JobType.CONTRACT],
-                min_description_length=200
-            )
-    
     async def search_llm_jobs(self, 
                              location: str = "Houston, TX",
                              max_pages: int = 3,
                              seniority_level: Optional[str] = None) -> Dict[str, Any]:
         """Search LinkedIn for LLM Engineer jobs."""
-        print(f"🔍 LinkedIn LLM Engineer Search")
-        print(f"📍 Location: {location}")
-        print(f"📄 Max pages: {max_pages}")
+        if self.verbose:
+            print(f"🔍 LinkedIn LLM Engineer Search")
+            print(f"📍 Location: {location}")
+            print(f"📄 Max pages: {max_pages}")
         
         # LinkedIn requires special handling - using public job search without login
         # Note: This approach uses LinkedIn's public job search which has limited access
         all_jobs = []
         
-        # LLM-specific search queries for LinkedIn
-        queries = [
-            "LLM Engineer",
-            "Large Language Model",
-            "Machine Learning Engineer",
-            "AI Engineer"
-        ]
-        
         try:
             # Use async context to ensure proper browser management
             async with self:
-                for query in queries[:2]:  # Limit to top 2 queries for LinkedIn
-                    print(f"🔍 Searching LinkedIn for: '{query}'")
-                    
+                for query in _LINKEDIN_QUERIES[:2]:  # Limit to top 2 queries for LinkedIn
                     # Build LinkedIn search URL
                     search_url = self._build_linkedin_search_url(query, location)
-                    print(f"   Navigating to: {search_url}")
+                    if self.verbose:
+                        print(f"🔍 Searching LinkedIn for: '{query}'")
+                        print(f"   Navigating to: {search_url}")
                     
                     # Navigate to search results
                     if not await self.safe_navigate(search_url):
@@ -115,9 +133,11 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
                         # Apply smart filtering
                         filtered_jobs = self.smart_filter.filter_jobs(page_jobs, verbose=False)
                         all_jobs.extend(filtered_jobs)
-                        print(f"   ✅ Found {len(page_jobs)} jobs, kept {len(filtered_jobs)} after filtering")
+                        if self.verbose:
+                            print(f"   ✅ Found {len(page_jobs)} jobs, kept {len(filtered_jobs)} after filtering")
                     else:
-                        print(f"   ⚠️ No jobs found for '{query}'")
+                        if self.verbose:
+                            print(f"   ⚠️ No jobs found for '{query}'")
                     
                     # Longer delay for LinkedIn (be respectful)
                     await self.random_delay(self.min_delay * 2, self.max_delay * 2)
@@ -125,7 +145,8 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
                     # Respect rate limiting (LinkedIn is strict)
                     self.requests_count += 1
                     if self.requests_count >= self.max_requests_per_session:
-                        print(f"   ⏸️ Rate limit reached, stopping searches")
+                        if self.verbose:
+                            print(f"   ⏸️ Rate limit reached, stopping searches")
                         break
                         
         except Exception as e:
@@ -137,25 +158,19 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
                 "error": str(e)
             }
         
-        print(f"✅ LinkedIn search complete: {len(all_jobs)} total jobs found")
+        if self.verbose:
+            print(f"✅ LinkedIn search complete: {len(all_jobs)} total jobs found")
         
         return {
             "jobs": all_jobs,
             "total_jobs_found": len(all_jobs),
             "status": "implemented_working",
             "message": f"LinkedIn scraper found {len(all_jobs)} LLM jobs",
-            "site_specific_features": [
-                "Professional network jobs",
-                "Company insights", 
-                "Network-based discovery",
-                "Premium role filtering"
-            ]
+            "site_specific_features": _SITE_SPECIFIC_FEATURES
         }
     
     def _build_linkedin_search_url(self, query: str, location: str) -> str:
         """Build LinkedIn jobs search URL with proper parameters."""
-        import urllib.parse
-        
         base_url = "https://www.linkedin.com/jobs/search"
         params = {
             "keywords": query,
@@ -167,7 +182,7 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
         }
         
         # Add query parameters
-        query_string = urllib.parse.urlencode(params)
+        query_string = urlencode(params)
         return f"{base_url}?{query_string}"
     
     async def _extract_linkedin_jobs(self) -> List:
@@ -183,7 +198,8 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
                 '.job-result-card, .jobs-search__results-list li, [data-job-id], .job-search-card'
             )
             
-            print(f"   📋 Found {len(job_cards)} job cards on LinkedIn")
+            if self.verbose:
+                print(f"   📋 Found {len(job_cards)} job cards on LinkedIn")
             
             for card in job_cards[:15]:  # Limit to first 15 jobs per page
                 try:
@@ -201,9 +217,6 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
     
     async def _extract_single_linkedin_job(self, card) -> Optional:
         """Extract a single job from LinkedIn job card."""
-        from ..models.job_models import JobListing, JobType, RemoteType
-        from datetime import datetime
-        
         try:
             # Extract title
             title_elem = await card.query_selector('h3 a, .job-result-card__title, .job-title a')
@@ -276,8 +289,6 @@ class LinkedInLLMScraper(PlaywrightJobScraper):
     
     def _parse_linkedin_salary(self, salary_text: str) -> tuple[Optional[int], Optional[int]]:
         """Parse LinkedIn salary string into min/max values."""
-        import re
-        
         if not salary_text:
             return None, None
             
@@ -314,8 +325,8 @@ async def test_linkedin_scraper():
     
     print(f"Status: {results['status']}")
     print(f"Message: {results['message']}")
-    print(f"Expected performance: {results['expected_performance']}")
-    print(f"Implementation approach: {results['implementation_details']['approach']}")
+    print(f"Jobs found: {results['total_jobs_found']}")
+    print(f"Site features: {', '.join(results.get('site_specific_features', []))}")
 
 
 if __name__ == "__main__":
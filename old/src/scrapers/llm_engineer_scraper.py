@@ -3,106 +3,204 @@ Specialized scraper for LLM Engineer and AI/ML Engineering positions.
 Optimized for finding cutting-edge AI roles with smart filtering.
 """
 
+import asyncio
+import functools
+import heapq
+from collections import Counter
+from operator import attrgetter
 from typing import List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
 from .filtered_ziprecruiter_scraper import FilteredZipRecruiterScraper
-from .smart_job_filter import JobFilter
-from ..models.job_models import JobType, RemoteType
+from .smart_job_filter import JobFilter, compile_tech_matcher, job_search_text
+from ..models.job_models import JobType, RemoteType, ScrapingResult
+
+# xxhash turns dedupe keys into 64-bit ints (cheaper to hash and store); fall back to strings
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Core LLM/AI keywords - job must have at least one
+_REQUIRED_KEYWORDS = (
+    # LLM/AI specific
+    "llm", "large language model", "gpt", "bert", "transformer",
+    "machine learning", "artificial intelligence", "ai engineer",
+    "ml engineer", "mlops", "ai/ml",
+    
+    # Deep learning frameworks
+    "pytorch", "tensorflow", "keras", "huggingface", "transformers",
+    "langchain", "llamaindex", "openai", "anthropic",
+    
+    # AI/ML technologies
+    "python", "machine learning", "deep learning", "neural network",
+    "nlp", "natural language processing", "computer vision",
+    "reinforcement learning", "generative ai", "conversational ai",
+    
+    # Cloud AI platforms
+    "aws sagemaker", "azure ml", "google cloud ai", "vertex ai",
+    "databricks", "mlflow", "kubeflow",
+    
+    # Vector databases and embeddings
+    "vector database", "embeddings", "chromadb", "pinecone", "weaviate",
+    "faiss", "semantic search", "retrieval", "rag"
+)
+
+# Keywords that indicate spam/irrelevant jobs
+_EXCLUDE_KEYWORDS = (
+    # Non-technical roles
+    "sales", "marketing", "recruiter", "cold calling", "door to door",
+    "commission only", "mlm", "pyramid", "telemarketing",
+    
+    # Low-level positions
+    "intern", "unpaid", "volunteer", "entry level",
+    
+    # Unrelated fields
+    "real estate", "insurance", "retail", "restaurant", "driver",
+    "warehouse", "construction", "manual labor",
+    
+    # Spam indicators
+    "make money fast", "work from home easy", "no experience needed"
+)
+
+# Optimized search queries for LLM roles
+_BASE_QUERIES = (
+    "LLM Engineer",
+    "Large Language Model Engineer",
+    "AI Engineer Machine Learning",
+    "ML Engineer NLP",
+    "Machine Learning Engineer AI",
+    "AI/ML Engineer",
+    "MLOps Engineer",
+    "Machine Learning Scientist",
+    "AI Research Engineer",
+    "Generative AI Engineer"
+)
+
+# Queries per normalized seniority level; unknown levels use _BASE_QUERIES
+_SENIOR_QUERIES = tuple(f"Senior {q}" for q in _BASE_QUERIES[:5])
+_QUERY_TABLE = {
+    "senior": _SENIOR_QUERIES,
+    "sr": _SENIOR_QUERIES,
+    **{level: tuple(f"{level.title()} {q}" for q in _BASE_QUERIES[:3])
+       for level in ("staff", "principal", "lead")},
+    **{level: _BASE_QUERIES[:3]  # Use simpler queries
+       for level in ("junior", "jr", "mid", "entry")},
+}
+
+# Number of best-ranked jobs returned in the results' "top_jobs"
+TOP_JOBS_COUNT = 5
+
+# Field getters for the ranking and stats passes (one C-level call per job)
+_RANK_FIELDS = attrgetter("quality_score", "salary_min")
+_STATS_FIELDS = attrgetter("quality_score", "salary_min", "salary_max")
+
+
+def _rank_key(job) -> tuple:
+    """Rank jobs by quality score, then minimum salary (missing salary ranks lowest)."""
+    quality, salary_min = _RANK_FIELDS(job)
+    return quality, salary_min or 0
+
+
+# Technologies counted in the search summary, matched in one scan per job
+_TECH_KEYWORDS = ("llm", "gpt", "transformer", "pytorch", "tensorflow", "huggingface", "langchain", "openai")
+_find_techs = compile_tech_matcher(_TECH_KEYWORDS)
+
+# Query parameters that only track the click, not which posting it is
+_TRACKING_PARAMS = frozenset(("trk", "trackingid", "refid", "source", "src", "ref", "gclid", "fbclid"))
+
+
+@functools.lru_cache(maxsize=4096)
+def canonical_job_url(url: str) -> str:
+    """
+    Canonical form of a job URL for deduplication.
+    
+    Lowercases the host, drops a trailing slash, the fragment and
+    utm_*/tracking query parameters. Other parameters are kept (some boards
+    put the job id in the query string), sorted so parameter order does not
+    matter.
+    """
+    parts = urlsplit(url)
+    params = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    query = f"?{urlencode(params)}" if params else ""
+    path = parts.path.rstrip("/")
+    return f"{parts.scheme}://{parts.netloc.lower()}{path}{query}"
+
+
+def _job_key(job):
+    """
+    Dedupe key for a job: xxh3 of its canonical URL (the URL itself without
+    xxhash), or company/title/location when it has no URL so distinct
+    URL-less jobs are not collapsed into one.
+    """
+    if not job.url:
+        return (job.company.casefold(), job.title.casefold(), job.location.casefold())
+    canonical = canonical_job_url(job.url)
+    return xxhash.xxh3_64_intdigest(canonical) if xxhash else canonical
+
+
+@functools.lru_cache(maxsize=2)
+def _build_llm_filter(strict_mode: bool) -> JobFilter:
+    """Create optimized filter for LLM Engineer positions (built once per mode and shared)."""
+    required_keywords = _REQUIRED_KEYWORDS
+    exclude_keywords = _EXCLUDE_KEYWORDS
+    
+    # Set different standards based on strict mode
+    if strict_mode:
+        # Stricter filtering for senior/specialized roles
+        return JobFilter(
+            required_keywords=required_keywords,
+            exclude_keywords=exclude_keywords,
+            min_quality_score=0.8,          # Very high quality only
+            min_salary=120000,              # Senior-level salaries
+            max_salary=400000,              # Cap at reasonable maximum
+            allowed_job_types=(JobType.FULL_TIME, JobType.CONTRACT, JobType.UNKNOWN),
+            allowed_remote_types=(RemoteType.REMOTE, RemoteType.HYBRID),
+            min_description_length=10,      # Allow short descriptions
+            exclude_experience_levels=("entry level", "intern", "junior")
+        )
+    else:
+        # More inclusive filtering for all LLM roles
+        return JobFilter(
+            required_keywords=required_keywords,
+            exclude_keywords=exclude_keywords,
+            min_quality_score=0.65,         # Good quality
+            min_salary=80000,               # Include mid-level roles
+            max_salary=500000,              # Higher cap for staff/principal
+            allowed_job_types=(JobType.FULL_TIME, JobType.CONTRACT, JobType.UNKNOWN),
+            allowed_remote_types=(RemoteType.REMOTE, RemoteType.HYBRID, RemoteType.ONSITE),
+            min_description_length=10       # Allow short descriptions
+        )
 
 
 class LLMEngineerScraper(FilteredZipRecruiterScraper):
     """Specialized scraper for LLM Engineer and AI/ML positions."""
     
-    def __init__(self, headless: bool = True, strict_mode: bool = False):
+    # Each query holds its own Playwright browser, so this caps browser memory too
+    MAX_CONCURRENT_QUERIES = 2
+    
+    # Stop after a query (from the 2nd on) whose share of new jobs falls below
+    # DIMINISHING_NEW_RATIO, once at least DIMINISHING_MIN_JOBS have been collected
+    DIMINISHING_NEW_RATIO = 0.1
+    DIMINISHING_MIN_JOBS = 20
+    
+    def __init__(self, headless: bool = True, strict_mode: bool = False, verbose: bool = True):
         """
         Initialize LLM Engineer scraper.
         
         Args:
             headless: Run browser in headless mode
             strict_mode: Use stricter filtering for senior/specialized roles
+            verbose: Print search progress and the summary (errors always print)
         """
         # Create LLM-specific filter
-        llm_filter = self._create_llm_filter(strict_mode)
+        llm_filter = _build_llm_filter(strict_mode)
         super().__init__(job_filter=llm_filter, headless=headless)
         self.strict_mode = strict_mode
-    
-    def _create_llm_filter(self, strict_mode: bool) -> JobFilter:
-        """Create optimized filter for LLM Engineer positions."""
-        
-        # Core LLM/AI keywords - job must have at least one
-        required_keywords = [
-            # LLM/AI specific
-            "llm", "large language model", "gpt", "bert", "transformer",
-            "machine learning", "artificial intelligence", "ai engineer",
-            "ml engineer", "mlops", "ai/ml",
-            
-            # Deep learning frameworks
-            "pytorch", "tensorflow", "keras", "huggingface", "transformers",
-            "langchain", "llamaindex", "openai", "anthropic",
-            
-            # AI/ML technologies
-            "python", "machine learning", "deep learning", "neural network",
-            "nlp", "natural language processing", "computer vision",
-            "reinforcement learning", "generative ai", "conversational ai",
-            
-            # Cloud AI platforms
-            "aws sagemaker", "azure ml", "google cloud ai", "vertex ai",
-            "databricks", "mlflow", "kubeflow",
-            
-            # Vector databases and embeddings
-            "vector database", "embeddings", "chromadb", "pinecone", "weaviate",
-            "faiss", "semantic search", "retrieval", "rag"
-        ]
-        
-        # Keywords that indicate spam/irrelevant jobs
-        exclude_keywords = [
-            # Non-technical roles
-            "sales", "marketing", "recruiter", "cold calling", "door to door",
-            "commission only", "mlm", "pyramid", "telemarketing",
-            
-            # Low-level positions
-            "intern", "unpaid", "volunteer", "entry level",
-            
-            # Unrelated fields
-            "real estate", "insurance", "retail", "restaurant", "driver",
-            "warehouse", "construction", "manual labor",
-            
-            # Spam indicators
-            "make money fast", "work from home easy", "no experience needed"
-        ]
-        
-        # Companies known for AI/ML work (prefer these)
-        preferred_companies = [
-            "openai", "anthropic", "google", "microsoft", "amazon", "meta",
-            "nvidia", "databricks", "huggingface", "cohere", "stability ai",
-            "scale ai", "deepmind", "tesla", "uber", "airbnb", "spotify"
-        ]
-        
-        # Set different standards based on strict mode
-        if strict_mode:
-            # Stricter filtering for senior/specialized roles
-            return JobFilter(
-                required_keywords=required_keywords,
-                exclude_keywords=exclude_keywords,
-                min_quality_score=0.8,          # Very high quality only
-                min_salary=120000,              # Senior-level salaries
-                max_salary=400000,              # Cap at reasonable maximum
-                allowed_job_types=[JobType.FULL_TIME, JobType.CONTRACT, JobType.UNKNOWN],
-                allowed_remote_types=[RemoteType.REMOTE, RemoteType.HYBRID],
-                min_description_length=10,      # Allow short descriptions
-                exclude_experience_levels=["entry level", "intern", "junior"]
-            )
-        else:
-            # More inclusive filtering for all LLM roles
-            return JobFilter(
-                required_keywords=required_keywords,
-                exclude_keywords=exclude_keywords,
-                min_quality_score=0.65,         # Good quality
-                min_salary=80000,               # Include mid-level roles
-                max_salary=500000,              # Higher cap for staff/principal
-                allowed_job_types=[JobType.FULL_TIME, JobType.CONTRACT, JobType.UNKNOWN],
-                allowed_remote_types=[RemoteType.REMOTE, RemoteType.HYBRID, RemoteType.ONSITE],
-                min_description_length=10       # Allow short descriptions
-            )
+        self.verbose = verbose
     
     async def search_llm_jobs(self, 
                              location: str = "Houston, TX",
@@ -119,128 +217,163 @@ class LLMEngineerScraper(FilteredZipRecruiterScraper):
         Returns:
             Dictionary with results and metadata
         """
-        # Build optimized search queries for LLM roles
-        base_queries = [
-            "LLM Engineer",
-            "Large Language Model Engineer", 
-            "AI Engineer Machine Learning",
-            "ML Engineer NLP",
-            "Machine Learning Engineer AI",
-            "AI/ML Engineer",
-            "MLOps Engineer",
-            "Machine Learning Scientist",
-            "AI Research Engineer",
-            "Generative AI Engineer"
-        ]
+        # Optimized search queries for the requested seniority (precomputed table)
+        base_queries = _QUERY_TABLE.get((seniority_level or "").lower(), _BASE_QUERIES)
         
-        # Add seniority if specified
-        if seniority_level:
-            if seniority_level.lower() in ["senior", "sr"]:
-                base_queries = [f"Senior {q}" for q in base_queries[:5]]
-            elif seniority_level.lower() in ["staff", "principal", "lead"]:
-                base_queries = [f"{seniority_level.title()} {q}" for q in base_queries[:3]]
-            elif seniority_level.lower() in ["junior", "jr", "mid", "entry"]:
-                base_queries = base_queries[:3]  # Use simpler queries
-        
-        print(f"🤖 Starting LLM Engineer job search in {location}")
-        print(f"🎯 Strict mode: {'ON' if self.strict_mode else 'OFF'}")
-        print(f"🔍 Search queries: {base_queries[:3]}...")
+        if self.verbose:
+            print(f"🤖 Starting LLM Engineer job search in {location}")
+            print(f"🎯 Strict mode: {'ON' if self.strict_mode else 'OFF'}")
+            print(f"🔍 Search queries: {list(base_queries[:3])}...")
         
         all_jobs = []
+        seen_keys = set()  # _job_key() values
         total_scraped = 0
         total_filtered = 0
         search_results = {}
         
-        # Try multiple search queries to get comprehensive results
-        for i, query in enumerate(base_queries[:3], 1):  # Limit to top 3 queries
-            print(f"\n📡 Search {i}/3: '{query}'")
-            
-            try:
-                # Override location in the search
-                result = await super().search_houston_jobs(
-                    query=query, 
-                    max_pages=max_pages,
-                    apply_smart_filter=True
-                )
+        # Try multiple search queries to get comprehensive results, concurrently;
+        # results are consumed in query order so later queries can be dropped
+        queries = base_queries[:3]  # Limit to top 3 queries
+        # Each query runs in its own browser session; created per call so it binds to this loop
+        query_semaphore = asyncio.BoundedSemaphore(self.MAX_CONCURRENT_QUERIES)
+        tasks = [
+            asyncio.create_task(self._run_query(i, len(queries), query, max_pages, query_semaphore))
+            for i, query in enumerate(queries, 1)
+        ]
+        
+        try:
+            for index, (query, task) in enumerate(zip(queries, tasks), 1):
+                try:
+                    result = await task
+                except Exception as e:
+                    print(f"   ❌ Error searching '{query}': {e}")
+                    continue
+                
+                if not result.jobs:
+                    if self.verbose:
+                        print(f"   ⚠️  No jobs found for '{query}'")
+                    continue
+                
+                # Avoid duplicates by checking canonical URLs (tracking params stripped)
+                new_jobs = []
+                for job in result.jobs:
+                    key = _job_key(job)
+                    if key not in seen_keys:
+                        seen_keys.add(key)
+                        new_jobs.append(job)
+                
+                all_jobs.extend(new_jobs)
+                total_scraped += result.metadata.get("jobs_before_filtering", len(result.jobs))
+                total_filtered += len(result.jobs)
                 
-                if result.jobs:
-                    # Avoid duplicates by checking URLs
-                    existing_urls = {job.url for job in all_jobs}
-                    new_jobs = [job for job in result.jobs if job.url not in existing_urls]
-                    
-                    all_jobs.extend(new_jobs)
-                    total_scraped += result.metadata.get("jobs_before_filtering", len(result.jobs))
-                    total_filtered += len(result.jobs)
-                    
-                    print(f"   ✅ Found {len(new_jobs)} new LLM jobs ({len(result.jobs)} total)")
-                else:
-                    print(f"   ⚠️  No jobs found for '{query}'")
-                    
-            except Exception as e:
-                print(f"   ❌ Error searching '{query}': {e}")
-                continue
+                if self.verbose:
+                    print(f"   ✅ '{query}': {len(new_jobs)} new LLM jobs ({len(result.jobs)} total)")
+                
+                # Overlapping queries stop paying off quickly; stop once one adds little
+                if (index >= 2 and index < len(queries)
+                        and len(all_jobs) >= self.DIMINISHING_MIN_JOBS
+                        and len(new_jobs) / len(result.jobs) < self.DIMINISHING_NEW_RATIO):
+                    if self.verbose:
+                        print(f"   ⏭️  Skipping remaining queries due to diminishing returns")
+                    break
+        finally:
+            # Cancel skipped queries and wait for their browser sessions to close
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Sort by quality score and salary
-        all_jobs.sort(key=lambda x: (x.quality_score, x.salary_min or 0), reverse=True)
+        # Aggregate quality and salary stats in one pass
+        quality_total = 0.0
+        salary_min_total = 0
+        lowest_salary = None
+        highest_salary = None
+        for quality, salary_min, salary_max in map(_STATS_FIELDS, all_jobs):
+            quality_total += quality
+            if salary_min:
+                salary_min_total += salary_min
+                if lowest_salary is None or salary_min < lowest_salary:
+                    lowest_salary = salary_min
+            if salary_max and (highest_salary is None or salary_max > highest_salary):
+                highest_salary = salary_max
         
         # Create comprehensive results
         search_results = {
             "jobs": all_jobs,
+            # Best jobs by quality score and salary (partial sort; "jobs" keeps search order)
+            "top_jobs": heapq.nlargest(TOP_JOBS_COUNT, all_jobs, key=_rank_key),
             "total_jobs_found": len(all_jobs),
             "total_jobs_scraped": total_scraped,
             "total_after_filtering": total_filtered,
             "filtering_efficiency": f"{len(all_jobs)/total_scraped*100:.1f}%" if total_scraped > 0 else "0%",
             "strict_mode": self.strict_mode,
-            "search_queries_used": base_queries[:3],
+            "search_queries_used": list(base_queries[:3]),
             "location": location,
-            "avg_quality_score": sum(job.quality_score for job in all_jobs) / len(all_jobs) if all_jobs else 0,
+            "avg_quality_score": quality_total / len(all_jobs) if all_jobs else 0,
             "salary_range": {
-                "min": min(job.salary_min for job in all_jobs if job.salary_min) if any(job.salary_min for job in all_jobs) else None,
-                "max": max(job.salary_max for job in all_jobs if job.salary_max) if any(job.salary_max for job in all_jobs) else None,
-                "avg": sum(job.salary_min or 0 for job in all_jobs) / len(all_jobs) if all_jobs else 0
+                "min": lowest_salary,
+                "max": highest_salary,
+                "avg": salary_min_total / len(all_jobs) if all_jobs else 0
             }
         }
         
-        # Print summary
-        self._print_search_summary(search_results)
+        # Print summary (skipped entirely when quiet)
+        if self.verbose:
+            self._print_search_summary(search_results)
         
         return search_results
     
+    async def _run_query(self, index: int, total: int, query: str, max_pages: int,
+                         semaphore: asyncio.Semaphore) -> ScrapingResult:
+        """Run one search query on its own ZipRecruiter session (a context on the shared browser, if set)."""
+        async with semaphore:
+            if self.verbose:
+                print(f"\n📡 Search {index}/{total}: '{query}'")
+            worker = FilteredZipRecruiterScraper(job_filter=self.job_filter_config, headless=self.headless)
+            worker.use_browser(self.shared_browser)
+            worker.request_semaphore = self.request_semaphore
+            async with worker:
+                return await worker.search_houston_jobs(
+                    query=query, 
+                    max_pages=max_pages,
+                    apply_smart_filter=True
+                )
+    
     def _print_search_summary(self, results: dict):
         """Print a summary of the LLM job search results."""
         jobs = results["jobs"]
         
-        print(f"\n🤖 LLM Engineer Search Summary")
-        print(f"=" * 40)
-        print(f"📊 Total LLM jobs found: {len(jobs)}")
-        print(f"🎯 Filtering efficiency: {results['filtering_efficiency']}")
-        print(f"⭐ Average quality score: {results['avg_quality_score']:.2f}")
+        # Collected and written in one print rather than a call per line
+        lines = [
+            f"\n🤖 LLM Engineer Search Summary",
+            f"=" * 40,
+            f"📊 Total LLM jobs found: {len(jobs)}",
+            f"🎯 Filtering efficiency: {results['filtering_efficiency']}",
+            f"⭐ Average quality score: {results['avg_quality_score']:.2f}",
+        ]
         
         if results['salary_range']['min']:
-            print(f"💰 Salary range: ${results['salary_range']['min']:,} - ${results['salary_range']['max']:,}")
-            print(f"💵 Average salary: ${results['salary_range']['avg']:,.0f}")
+            lines.append(f"💰 Salary range: ${results['salary_range']['min']:,} - ${results['salary_range']['max']:,}")
+            lines.append(f"💵 Average salary: ${results['salary_range']['avg']:,.0f}")
         
         if jobs:
-            print(f"\n🏆 Top 3 LLM Jobs:")
-            for i, job in enumerate(jobs[:3], 1):
+            lines.append(f"\n🏆 Top 3 LLM Jobs:")
+            for i, job in enumerate(results["top_jobs"][:3], 1):
                 salary_str = f"${job.salary_min:,}-${job.salary_max:,}" if job.salary_min and job.salary_max else "Salary not specified"
-                print(f"   {i}. {job.title} at {job.company}")
-                print(f"      💰 {salary_str} | ⭐ {job.quality_score:.2f} | 🏠 {job.remote_type.value}")
+                lines.append(f"   {i}. {job.title} at {job.company}")
+                lines.append(f"      💰 {salary_str} | ⭐ {job.quality_score:.2f} | 🏠 {job.remote_type.value}")
         
-        # Show technology breakdown
-        tech_keywords = ["llm", "gpt", "transformer", "pytorch", "tensorflow", "huggingface", "langchain", "openai"]
-        tech_counts = {}
+        # Show technology breakdown (each tech counted once per job)
+        tech_counts = Counter()
         
         for job in jobs:
-            job_text = f"{job.title} {job.description} {' '.join(job.skills)}".lower()
-            for tech in tech_keywords:
-                if tech in job_text:
-                    tech_counts[tech] = tech_counts.get(tech, 0) + 1
+            tech_counts.update(_find_techs(job_search_text(job)))
         
         if tech_counts:
-            print(f"\n🔧 Technology mentions:")
-            for tech, count in sorted(tech_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                print(f"   • {tech.upper()}: {count} jobs")
+            lines.append(f"\n🔧 Technology mentions:")
+            for tech, count in tech_counts.most_common(5):
+                lines.append(f"   • {tech.upper()}: {count} jobs")
+        
+        print("\n".join(lines))
 
 
 # Convenience functions for different LLM Engineer levels
@@ -279,5 +412,4 @@ async def demo_llm_scraping():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(demo_llm_scraping())
@@ -4,20 +4,89 @@ Finds LLM/AI engineering jobs from ZipRecruiter, Indeed, LinkedIn, and more.
 """
 
 import asyncio
-from typing import List, Dict, Optional, Any
+import json
+import os
+import statistics
+import time
+from collections import Counter
+from operator import itemgetter
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Any, Tuple, Union
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, timedelta
 
-from .llm_engineer_scraper import LLMEngineerScraper
+import numpy as np
+from playwright.async_api import async_playwright
+
+from .playwright_scraper import PlaywrightJobScraper
+from .llm_engineer_scraper import LLMEngineerScraper, canonical_job_url
 from .indeed_llm_scraper import IndeedLLMScraper
 from .linkedin_llm_scraper import LinkedInLLMScraper
 from .glassdoor_llm_scraper import GlassdoorLLMScraper
 from .angellist_llm_scraper import AngelListLLMScraper
-from .smart_job_filter import JobFilter
+from .smart_job_filter import JobFilter, compile_tech_matcher, job_search_text
 from ..models.job_models import JobListing, JobType, RemoteType, ScrapingResult
 
+# Technologies tallied in the multi-site summary
+_TECH_KEYWORDS = (
+    "llm", "gpt", "transformer", "bert", "t5",
+    "pytorch", "tensorflow", "keras", "jax",
+    "huggingface", "langchain", "llamaindex",
+    "openai", "anthropic", "cohere",
+    "python", "scala", "java", "go",
+    "aws", "azure", "gcp", "kubernetes",
+    "mlflow", "wandb", "neptune",
+    "vector", "embedding", "rag", "fine-tuning"
+)
+
+# Whole-word matcher shared with the LLM engineer summary ("go" doesn't match "google")
+_find_techs = compile_tech_matcher(_TECH_KEYWORDS)
+
+
+def _count_techs(texts: List[str]) -> Counter:
+    """Number of texts mentioning each technology."""
+    tech_counts = Counter()
+    for text in texts:
+        tech_counts.update(_find_techs(text))
+    return tech_counts
+
+
+def _job_key(job: JobListing):
+    """
+    Dedupe key for a job: its canonical URL (tracking params, fragment and
+    trailing slash ignored), or company/title/location when it has no URL so
+    distinct URL-less jobs are not collapsed into one.
+    """
+    if job.url:
+        return canonical_job_url(job.url)
+    return (job.company.casefold(), job.title.casefold(), job.location.casefold())
+
+
+# Jobs buffered between the site searches and the consumer before producers wait
+JOB_QUEUE_SIZE = 256
+
+# Above this many jobs, ranking uses one numpy lexsort instead of a key-function sort
+NUMPY_SORT_THRESHOLD = 2000
+
 
-@dataclass
+def _rank_jobs(jobs: List[JobListing]) -> List[JobListing]:
+    """Order jobs by quality score, then minimum salary, best first (ties keep input order)."""
+    if len(jobs) < NUMPY_SORT_THRESHOLD:
+        return sorted(jobs, key=lambda x: (x.quality_score, x.salary_min or 0), reverse=True)
+    
+    count = len(jobs)
+    quality = np.fromiter((job.quality_score for job in jobs), dtype=np.float64, count=count)
+    salary = np.fromiter((job.salary_min or 0 for job in jobs), dtype=np.float64, count=count)
+    # lexsort is stable and sorts by the last key first; negate for descending order
+    order = np.lexsort((-salary, -quality))
+    return [jobs[i] for i in order.tolist()]
+
+
+# Jobs whose URL was seen by a previous run within this many days are skipped
+DEDUP_WINDOW_DAYS = 7
+
+
+@dataclass(slots=True)
 class MultiSiteResult:
     """Results from searching multiple job sites."""
     all_jobs: List[JobListing]
@@ -28,7 +97,7 @@ class MultiSiteResult:
     failed_sites: List[str]
     search_duration: float
     best_site: str
-    technology_breakdown: Dict[str, int]
+    technology_breakdown: Counter
     salary_analysis: Dict[str, Any]
 
 
@@ -44,33 +113,48 @@ class MultiSiteLLMScraper:
     - AngelList (placeholder for future implementation)
     """
     
-    def __init__(self, headless: bool = True, strict_mode: bool = False):
+    # Available scrapers; only the sites actually searched get instantiated
+    _SCRAPER_CLASSES = {
+        "ziprecruiter": LLMEngineerScraper,
+        "indeed": IndeedLLMScraper,
+        "linkedin": LinkedInLLMScraper,
+        "glassdoor": GlassdoorLLMScraper,
+        "angellist": AngelListLLMScraper,
+    }
+    
+    # Lowest per-site slow_mo (ZipRecruiter); per-site random delays still apply
+    SHARED_BROWSER_SLOW_MO = 200
+    
+    def __init__(self, headless: bool = True, strict_mode: bool = False, max_concurrent_sites: int = 3,
+                 state_path: Optional[Union[str, Path]] = None):
         """
         Initialize multi-site LLM scraper.
         
         Args:
             headless: Run browsers in headless mode
             strict_mode: Use strict filtering across all sites
+            max_concurrent_sites: Most sites (browsers) searched at once
+            state_path: Optional JSON file of URLs seen by earlier runs; jobs seen
+                within DEDUP_WINDOW_DAYS are skipped (disabled when None)
         """
         self.headless = headless
         self.strict_mode = strict_mode
+        self.max_concurrent_sites = max_concurrent_sites
+        self.state_path = Path(state_path) if state_path else None
         
-        # Initialize available scrapers
-        from .indeed_llm_scraper import IndeedLLMScraper
+        # One browser shared by every site scraper, launched by start()
+        self._playwright = None
+        self._browser = None
         
-        self.scrapers = {
-            "ziprecruiter": LLMEngineerScraper(headless=headless, strict_mode=strict_mode),
-            "indeed": IndeedLLMScraper(headless=headless, strict_mode=strict_mode),
-            "linkedin": LinkedInLLMScraper(headless=headless, strict_mode=strict_mode),
-            "glassdoor": GlassdoorLLMScraper(headless=headless, strict_mode=strict_mode),
-            "angellist": AngelListLLMScraper(headless=headless, strict_mode=strict_mode),
-        }
+        # Site scrapers, created on first use by _get_scraper()
+        self._scraper_cache: Dict[str, PlaywrightJobScraper] = {}
         
         # Site-specific configurations
         self.site_configs = {
             "ziprecruiter": {
                 "enabled": True,
                 "max_pages": 3,
+                "max_concurrency": 4,  # In-flight page loads to this site
                 "priority": 1,
                 "expected_results": "medium",
                 "specialties": ["general", "remote", "contract"]
@@ -78,6 +162,7 @@ class MultiSiteLLMScraper:
             "indeed": {
                 "enabled": True,  # Now implemented!
                 "max_pages": 3,  # Conservative for testing
+                "max_concurrency": 8,
                 "priority": 2,
                 "expected_results": "high",
                 "specialties": ["volume", "local", "enterprise"]
@@ -85,6 +170,7 @@ class MultiSiteLLMScraper:
             "linkedin": {
                 "enabled": True,   # Now implemented!
                 "max_pages": 2,    # Conservative for LinkedIn
+                "max_concurrency": 2,
                 "priority": 3,
                 "expected_results": "high_quality",
                 "specialties": ["senior", "remote", "tech_companies"]
@@ -92,6 +178,7 @@ class MultiSiteLLMScraper:
             "glassdoor": {
                 "enabled": True,   # Now implemented!
                 "max_pages": 2,    # Conservative for Glassdoor
+                "max_concurrency": 2,
                 "priority": 4,
                 "expected_results": "salary_focused",
                 "specialties": ["salary_info", "company_reviews", "interview_insights"]
@@ -99,17 +186,72 @@ class MultiSiteLLMScraper:
             "angellist": {
                 "enabled": True,   # Now implemented!
                 "max_pages": 2,    # Conservative for startup platform
+                "max_concurrency": 2,
                 "priority": 5,
                 "expected_results": "startup_focused",
                 "specialties": ["startups", "equity", "early_stage", "founding_engineer"]
             }
         }
+
+    def _get_scraper(self, site_name: str) -> PlaywrightJobScraper:
+        """Return the scraper for a site, creating it the first time it is searched."""
+        scraper = self._scraper_cache.get(site_name)
+        if scraper is None:
+            scraper_class = self._SCRAPER_CLASSES[site_name]
+            scraper = scraper_class(headless=self.headless, strict_mode=self.strict_mode)
+            if self._browser:
+                scraper.use_browser(self._browser)
+            self._scraper_cache[site_name] = scraper
+        return scraper
+    
+    async def __aenter__(self):
+        """Async context manager entry: launch the shared browser."""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+    
+    async def start(self):
+        """
+        Launch one browser and hand it to every site scraper, including ones created later.
+        
+        Optional: without it each scraper launches its own browser. With it,
+        sites share one browser process and only open their own contexts.
+        """
+        if self._browser and self._browser.is_connected():
+            return
+        
+        print("Starting shared Playwright browser...")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=self.SHARED_BROWSER_SLOW_MO,
+            args=PlaywrightJobScraper.LAUNCH_ARGS
+        )
+        for scraper in self._scraper_cache.values():
+            scraper.use_browser(self._browser)
+    
+    async def aclose(self):
+        """Close the shared browser; scrapers go back to launching their own."""
+        for scraper in self._scraper_cache.values():
+            scraper.use_browser(None)
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+            print("✓ Shared browser closed")
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
     
     async def search_all_sites(self, 
                               location: str = "Houston, TX",
                               max_pages_per_site: Optional[int] = None,
                               sites_to_search: Optional[List[str]] = None,
-                              seniority_level: Optional[str] = None) -> MultiSiteResult:
+                              seniority_level: Optional[str] = None,
+                              max_concurrent_sites: Optional[int] = None,
+                              use_dedup_state: bool = True) -> MultiSiteResult:
         """
         Search for LLM Engineer jobs across multiple sites.
         
@@ -118,11 +260,13 @@ class MultiSiteLLMScraper:
             max_pages_per_site: Override default pages per site
             sites_to_search: Specific sites to search (default: all enabled)
             seniority_level: "junior", "mid", "senior", "staff"
+            max_concurrent_sites: Override the scraper's concurrent site limit
+            use_dedup_state: Skip jobs seen by earlier runs (needs state_path)
             
         Returns:
             MultiSiteResult with aggregated results
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Determine which sites to search
         if sites_to_search is None:
@@ -139,86 +283,38 @@ class MultiSiteLLMScraper:
         
         all_jobs = []
         site_results = {}
-        successful_sites = []
-        failed_sites = []
         
-        # Search each site
-        for site_name in sites_to_search:
-            if site_name not in self.scrapers:
-                print(f"\n❌ {site_name.title()}: Not implemented yet")
-                failed_sites.append(site_name)
+        # URLs recorded by earlier runs (url -> ISO date first seen)
+        use_state = use_dedup_state and self.state_path is not None
+        seen_state = self._load_seen_state() if use_state else {}
+        skipped_seen = 0
+        
+        # Collect the streamed jobs (already deduplicated across sites)
+        async for _site_name, job in self.stream_jobs(
+            location=location,
+            max_pages_per_site=max_pages_per_site,
+            sites_to_search=sites_to_search,
+            seniority_level=seniority_level,
+            max_concurrent_sites=max_concurrent_sites,
+            site_results=site_results
+        ):
+            if job.url and canonical_job_url(job.url) in seen_state:
+                skipped_seen += 1
                 continue
-            
-            print(f"\n🔍 Searching {site_name.title()}...")
-            
-            try:
-                # Get site-specific configuration
-                config = self.site_configs[site_name]
-                pages = max_pages_per_site or config["max_pages"]
-                
-                # Perform the search
-                scraper = self.scrapers[site_name]
-                
-                if site_name == "ziprecruiter":
-                    # Use ZipRecruiter-specific search method
-                    result = await scraper.search_llm_jobs(
-                        location=location,
-                        max_pages=pages,
-                        seniority_level=seniority_level
-                    )
-                    
-                    jobs = result["jobs"]
-                    site_metadata = {
-                        "jobs_found": len(jobs),
-                        "search_queries": result.get("search_queries_used", []),
-                        "filtering_efficiency": result.get("filtering_efficiency", "N/A"),
-                        "avg_quality_score": result.get("avg_quality_score", 0),
-                        "salary_range": result.get("salary_range", {}),
-                        "pages_scraped": pages,
-                        "status": "success"
-                    }
-                
-                elif site_name == "indeed":
-                    # Use Indeed-specific search method
-                    result = await scraper.search_llm_jobs(
-                        location=location,
-                        max_pages=pages,
-                        seniority_level=seniority_level
-                    )
-                    
-                    jobs = result.get("jobs", [])
-                    site_metadata = {
-                        "jobs_found": len(jobs),
-                        "status": result.get("status", "success"),
-                        "message": result.get("message", ""),
-                        "expected_performance": result.get("expected_performance", {}),
-                        "pages_scraped": pages
-                    }
-                
-                else:
-                    # Generic interface for future site implementations
-                    # result = await scraper.search_llm_jobs(location, pages, seniority_level)
-                    jobs = []
-                    site_metadata = {"status": "not_implemented"}
-                
-                # Deduplicate against existing jobs
-                existing_urls = {job.url for job in all_jobs}
-                new_jobs = [job for job in jobs if job.url not in existing_urls]
-                
-                all_jobs.extend(new_jobs)
-                site_results[site_name] = site_metadata
-                successful_sites.append(site_name)
-                
-                print(f"   ✅ Found {len(new_jobs)} unique LLM jobs")
-                
-            except Exception as e:
-                print(f"   ❌ Error searching {site_name}: {e}")
-                failed_sites.append(site_name)
-                site_results[site_name] = {"status": "failed", "error": str(e)}
+            all_jobs.append(job)
+        
+        # Report sites in the requested order, not completion order
+        site_results = {site: site_results[site] for site in sites_to_search if site in site_results}
+        successful_sites = [site for site, results in site_results.items() if results.get("status") != "failed"]
+        failed_sites = [site for site in sites_to_search if site not in successful_sites]
         
-        # Calculate search duration
-        end_time = datetime.now()
-        search_duration = (end_time - start_time).total_seconds()
+        if use_state:
+            if skipped_seen:
+                print(f"\n⏭️  Skipped {skipped_seen} jobs already seen in the last {DEDUP_WINDOW_DAYS} days")
+            self._save_seen_state(seen_state, all_jobs)
+        
+        # Calculate search duration (monotonic clock, immune to wall-clock changes)
+        search_duration = time.perf_counter() - start_time
         
         # Determine best performing site
         best_site = self._find_best_site(site_results)
@@ -228,7 +324,7 @@ class MultiSiteLLMScraper:
         salary_analysis = self._analyze_salaries(all_jobs)
         
         # Sort jobs by quality and salary
-        all_jobs.sort(key=lambda x: (x.quality_score, x.salary_min or 0), reverse=True)
+        all_jobs = _rank_jobs(all_jobs)
         
         # Create comprehensive result
         result = MultiSiteResult(
@@ -249,57 +345,235 @@ class MultiSiteLLMScraper:
         
         return result
     
+    async def stream_jobs(self,
+                          location: str = "Houston, TX",
+                          max_pages_per_site: Optional[int] = None,
+                          sites_to_search: Optional[List[str]] = None,
+                          seniority_level: Optional[str] = None,
+                          max_concurrent_sites: Optional[int] = None,
+                          site_results: Optional[Dict[str, Dict[str, Any]]] = None
+                          ) -> AsyncIterator[Tuple[str, JobListing]]:
+        """
+        Yield (site_name, job) pairs as the sites produce them.
+        
+        Sites run concurrently (at most max_concurrent_sites at once) and feed a
+        bounded queue, so callers can start storing or analyzing jobs before the
+        slowest site is done.
+        Jobs are deduplicated across sites by canonical URL (see _job_key).
+        
+        Args:
+            location: Job location
+            max_pages_per_site: Override default pages per site
+            sites_to_search: Specific sites to search (default: all enabled)
+            seniority_level: "junior", "mid", "senior", "staff"
+            max_concurrent_sites: Override the scraper's concurrent site limit
+            site_results: Optional dict that receives each site's metadata,
+                or {"status": "failed", "error": ...} for sites that errored
+        """
+        if sites_to_search is None:
+            sites_to_search = [site for site, config in self.site_configs.items() 
+                             if config["enabled"]]
+        if site_results is None:
+            site_results = {}
+        
+        # Sites without a scraper fail up front instead of spawning a task
+        runnable_sites = []
+        for site_name in sites_to_search:
+            if site_name in self._SCRAPER_CLASSES:
+                runnable_sites.append(site_name)
+            else:
+                print(f"\n❌ {site_name.title()}: Not implemented yet")
+        
+        # Search sites concurrently; total time tracks the slowest site, not the sum.
+        # Sites push jobs onto a bounded queue as they are found, so dedupe and the
+        # caller's processing overlap with scraping; a full queue pauses producers.
+        # Created here so the semaphore and queue bind to the running event loop.
+        site_semaphore = asyncio.BoundedSemaphore(max_concurrent_sites or self.max_concurrent_sites)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+        
+        # Per-site navigation limit, shared by everything that loads that site's pages;
+        # set on the cached scrapers for this call only, for the same reason
+        for site_name in runnable_sites:
+            scraper = self._get_scraper(site_name)
+            scraper.request_semaphore = asyncio.Semaphore(self.site_configs[site_name]["max_concurrency"])
+        
+        async def produce(site_name: str):
+            async def emit(job: JobListing):
+                await queue.put((site_name, job, None))
+            
+            async with site_semaphore:
+                try:
+                    outcome = await self._search_one(site_name, location, max_pages_per_site,
+                                                     seniority_level, emit)
+                except Exception as e:
+                    outcome = e
+            # A job of None marks the site as finished, with its metadata or error
+            await queue.put((site_name, None, outcome))
+        
+        tasks = [asyncio.create_task(produce(site_name)) for site_name in runnable_sites]
+        seen_keys = set()  # _job_key() values
+        unique_counts = Counter()
+        pending_sites = len(tasks)
+        
+        try:
+            while pending_sites:
+                site_name, job, outcome = await queue.get()
+                
+                if job is not None:
+                    # Deduplicate against jobs from other sites (and within this site)
+                    key = _job_key(job)
+                    if key not in seen_keys:
+                        seen_keys.add(key)
+                        unique_counts[site_name] += 1
+                        yield site_name, job
+                    continue
+                
+                pending_sites -= 1
+                if isinstance(outcome, Exception):
+                    print(f"   ❌ Error searching {site_name}: {outcome}")
+                    site_results[site_name] = {"status": "failed", "error": str(outcome)}
+                else:
+                    site_results[site_name] = outcome
+                    print(f"   ✅ {site_name.title()}: Found {unique_counts[site_name]} unique LLM jobs")
+                # Wall-clock epoch seconds, so site_results stays JSON-serializable
+                site_results[site_name]["searched_at"] = int(time.time())
+        finally:
+            # Stop sites still running if the caller stops consuming early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _search_one(self,
+                          site_name: str,
+                          location: str,
+                          max_pages_per_site: Optional[int],
+                          seniority_level: Optional[str],
+                          emit: Callable[[JobListing], Awaitable[None]]) -> Dict[str, Any]:
+        """Search a single site, passing each job to emit, and return the site metadata."""
+        print(f"\n🔍 Searching {site_name.title()}...")
+        
+        # Get site-specific configuration
+        config = self.site_configs[site_name]
+        pages = max_pages_per_site or config["max_pages"]
+        
+        # Perform the search
+        scraper = self._get_scraper(site_name)
+        
+        if site_name == "ziprecruiter":
+            # Use ZipRecruiter-specific search method
+            result = await scraper.search_llm_jobs(
+                location=location,
+                max_pages=pages,
+                seniority_level=seniority_level
+            )
+            
+            jobs = result["jobs"]
+            for job in jobs:
+                await emit(job)
+            
+            site_metadata = {
+                "jobs_found": len(jobs),
+                "search_queries": result.get("search_queries_used", []),
+                "filtering_efficiency": result.get("filtering_efficiency", "N/A"),
+                "avg_quality_score": result.get("avg_quality_score", 0),
+                "salary_range": result.get("salary_range", {}),
+                "pages_scraped": pages,
+                "status": "success"
+            }
+        
+        elif site_name == "indeed":
+            # Stream Indeed jobs as each of its queries finishes
+            jobs_found = 0
+            try:
+                async for job in scraper.iter_llm_jobs(location):
+                    jobs_found += 1
+                    await emit(job)
+            except Exception as e:
+                print(f"❌ Indeed search error: {e}")
+                return {"jobs_found": jobs_found, "status": "error", "error": str(e), "pages_scraped": pages}
+            
+            site_metadata = {
+                "jobs_found": jobs_found,
+                "status": "implemented_working",
+                "message": f"Indeed scraper found {jobs_found} LLM jobs",
+                "pages_scraped": pages
+            }
+        
+        else:
+            # Generic interface for future site implementations
+            # result = await scraper.search_llm_jobs(location, pages, seniority_level)
+            site_metadata = {"status": "not_implemented"}
+        
+        return site_metadata
+    
+    def _load_seen_state(self) -> Dict[str, str]:
+        """Load URLs seen within the dedup window from the state file."""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                seen = json.load(f).get("seen", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️  Could not read dedup state {self.state_path}: {e}")
+            return {}
+        
+        # ISO dates compare correctly as strings
+        cutoff = (date.today() - timedelta(days=DEDUP_WINDOW_DAYS)).isoformat()
+        return {url: seen_on for url, seen_on in seen.items() if seen_on >= cutoff}
+    
+    def _save_seen_state(self, seen_state: Dict[str, str], jobs: List[JobListing]):
+        """Record this run's job URLs and write the state file atomically."""
+        today = date.today().isoformat()
+        for job in jobs:
+            if job.url:
+                seen_state.setdefault(canonical_job_url(job.url), today)
+        
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"seen": seen_state}, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            print(f"⚠️  Could not write dedup state {self.state_path}: {e}")
+    
     def _find_best_site(self, site_results: Dict[str, Dict]) -> str:
         """Determine which site performed best."""
-        best_site = ""
-        best_score = 0
-        
-        for site, results in site_results.items():
-            if results.get("status") == "success":
-                # Score based on jobs found and quality
-                jobs_found = results.get("jobs_found", 0)
-                avg_quality = results.get("avg_quality_score", 0)
-                score = jobs_found * avg_quality
-                
-                if score > best_score:
-                    best_score = score
-                    best_site = site
+        # Score based on jobs found and quality; max() keeps the first site on ties
+        scores = ((site, results.get("jobs_found", 0) * results.get("avg_quality_score", 0))
+                  for site, results in site_results.items()
+                  if results.get("status") == "success")
+        best_site, best_score = max(scores, key=itemgetter(1), default=("none", 0))
         
-        return best_site or "none"
+        return best_site if best_score > 0 else "none"
     
     def _analyze_technologies(self, jobs: List[JobListing]) -> Dict[str, int]:
-        """Analyze technology mentions across all jobs."""
-        tech_keywords = [
-            "llm", "gpt", "transformer", "bert", "t5",
-            "pytorch", "tensorflow", "keras", "jax",
-            "huggingface", "langchain", "llamaindex",
-            "openai", "anthropic", "cohere",
-            "python", "scala", "java", "go",
-            "aws", "azure", "gcp", "kubernetes",
-            "mlflow", "wandb", "neptune",
-            "vector", "embedding", "rag", "fine-tuning"
-        ]
-        
-        tech_counts = {}
+        """
+        Analyze technology mentions across all jobs (number of jobs mentioning each).
         
-        for job in jobs:
-            job_text = f"{job.title} {job.description} {' '.join(job.skills)}".lower()
-            for tech in tech_keywords:
-                if tech in job_text:
-                    tech_counts[tech] = tech_counts.get(tech, 0) + 1
+        Returns a Counter; use most_common(n) for the top entries.
+        """
+        if not jobs:
+            return Counter()
         
-        # Sort by frequency
-        return dict(sorted(tech_counts.items(), key=lambda x: x[1], reverse=True))
+        return _count_techs([job_search_text(job) for job in jobs])
     
     def _analyze_salaries(self, jobs: List[JobListing]) -> Dict[str, Any]:
-        """Analyze salary information across all jobs."""
+        """Analyze salary information across all jobs (single pass)."""
+        if not jobs:
+            return {"message": "No salary data available"}
+        
         salaries = []
+        jobs_with_salary = 0
         
         for job in jobs:
-            if job.salary_min:
-                salaries.append(job.salary_min)
-            if job.salary_max and job.salary_max != job.salary_min:
-                salaries.append(job.salary_max)
+            salary_min, salary_max = job.salary_min, job.salary_max
+            if salary_min or salary_max:
+                jobs_with_salary += 1
+            if salary_min:
+                salaries.append(salary_min)
+            if salary_max and salary_max != salary_min:
+                salaries.append(salary_max)
         
         if not salaries:
             return {"message": "No salary data available"}
@@ -308,57 +582,65 @@ class MultiSiteLLMScraper:
             "min": min(salaries),
             "max": max(salaries),
             "avg": sum(salaries) / len(salaries),
-            "median": sorted(salaries)[len(salaries) // 2],
-            "jobs_with_salary": len([j for j in jobs if j.salary_min or j.salary_max]),
+            # Upper median (same element the previous sorted()[n // 2] picked)
+            "median": statistics.median_high(salaries),
+            "jobs_with_salary": jobs_with_salary,
             "total_jobs": len(jobs),
-            "salary_coverage": len([j for j in jobs if j.salary_min or j.salary_max]) / len(jobs) * 100
+            "salary_coverage": jobs_with_salary / len(jobs) * 100
         }
     
     def _print_multi_site_summary(self, result: MultiSiteResult):
         """Print comprehensive multi-site search summary."""
-        print(f"\n🌐 Multi-Site LLM Search Results")
-        print(f"=" * 45)
-        print(f"⏱️  Search duration: {result.search_duration:.1f} seconds")
-        print(f"🎯 Total LLM jobs found: {result.total_jobs_found}")
-        print(f"✅ Successful sites: {len(result.successful_sites)}/{result.total_sites_searched}")
-        print(f"🏆 Best performing site: {result.best_site.title()}")
+        # Collected and written in one print so concurrent output cannot interleave it
+        lines = [
+            f"\n🌐 Multi-Site LLM Search Results",
+            f"=" * 45,
+            f"⏱️  Search duration: {result.search_duration:.1f} seconds",
+            f"🎯 Total LLM jobs found: {result.total_jobs_found}",
+            f"✅ Successful sites: {len(result.successful_sites)}/{result.total_sites_searched}",
+            f"🏆 Best performing site: {result.best_site.title()}",
+        ]
         
         # Site breakdown
-        print(f"\n📊 Site Performance:")
+        lines.append(f"\n📊 Site Performance:")
         for site, results in result.site_results.items():
+            display = site.title()
             status = results.get("status", "unknown")
             if status == "success":
                 jobs = results.get("jobs_found", 0)
                 quality = results.get("avg_quality_score", 0)
-                print(f"   ✅ {site.title()}: {jobs} jobs (avg quality: {quality:.2f})")
+                lines.append(f"   ✅ {display}: {jobs} jobs (avg quality: {quality:.2f})")
             elif status == "not_implemented":
-                print(f"   ⏳ {site.title()}: Not implemented yet")
+                lines.append(f"   ⏳ {display}: Not implemented yet")
             else:
-                print(f"   ❌ {site.title()}: Failed ({results.get('error', 'unknown error')})")
+                lines.append(f"   ❌ {display}: Failed ({results.get('error', 'unknown error')})")
         
         # Salary analysis
         if "message" not in result.salary_analysis:
             salary = result.salary_analysis
-            print(f"\n💰 Salary Analysis:")
-            print(f"   Range: ${salary['min']:,} - ${salary['max']:,}")
-            print(f"   Average: ${salary['avg']:,.0f}")
-            print(f"   Coverage: {salary['salary_coverage']:.1f}% of jobs have salary info")
+            lines.append(f"\n💰 Salary Analysis:")
+            lines.append(f"   Range: ${salary['min']:,} - ${salary['max']:,}")
+            lines.append(f"   Average: ${salary['avg']:,.0f}")
+            lines.append(f"   Coverage: {salary['salary_coverage']:.1f}% of jobs have salary info")
         
         # Top technologies
         if result.technology_breakdown:
-            print(f"\n🔧 Top Technologies:")
-            for tech, count in list(result.technology_breakdown.items())[:8]:
-                percentage = count / result.total_jobs_found * 100
-                print(f"   • {tech.upper()}: {count} jobs ({percentage:.1f}%)")
+            lines.append(f"\n🔧 Top Technologies:")
+            percent_per_job = 100.0 / result.total_jobs_found
+            for tech, count in result.technology_breakdown.most_common(8):
+                percentage = count * percent_per_job
+                lines.append(f"   • {tech.upper()}: {count} jobs ({percentage:.1f}%)")
         
         # Top jobs
         if result.all_jobs:
-            print(f"\n🏆 Top 3 LLM Jobs Across All Sites:")
+            lines.append(f"\n🏆 Top 3 LLM Jobs Across All Sites:")
             for i, job in enumerate(result.all_jobs[:3], 1):
                 salary_str = f"${job.salary_min:,}-${job.salary_max:,}" if job.salary_min and job.salary_max else "Salary TBD"
-                print(f"   {i}. {job.title} at {job.company}")
-                print(f"      💰 {salary_str} | ⭐ {job.quality_score:.2f} | 🌐 {job.source}")
-                print(f"      🏠 {job.remote_type.value} | 📍 {job.location}")
+                lines.append(f"   {i}. {job.title} at {job.company}")
+                lines.append(f"      💰 {salary_str} | ⭐ {job.quality_score:.2f} | 🌐 {job.source}")
+                lines.append(f"      🏠 {job.remote_type.value} | 📍 {job.location}")
+        
+        print("\n".join(lines))
     
     def get_site_status(self) -> Dict[str, Any]:
         """Get status of all supported job sites."""
@@ -366,7 +648,7 @@ class MultiSiteLLMScraper:
         
         for site, config in self.site_configs.items():
             status[site] = {
-                "implemented": site in self.scrapers,
+                "implemented": site in self._SCRAPER_CLASSES,
                 "enabled": config["enabled"],
                 "priority": config["priority"],
                 "expected_results": config["expected_results"],
@@ -420,14 +702,15 @@ async def demo_multi_site_search():
         enabled = "ON" if status["enabled"] else "OFF"
         print(f"   {impl} {site.title()}: {enabled} - {status['expected_results']}")
     
-    # Perform multi-site search
+    # Perform multi-site search on one shared browser
     print(f"\n🔍 Starting multi-site search...")
     try:
-        results = await scraper.search_all_sites(
-            location="Houston, TX",
-            max_pages_per_site=1,  # Small test
-            seniority_level="senior"
-        )
+        async with scraper:
+            results = await scraper.search_all_sites(
+                location="Houston, TX",
+                max_pages_per_site=1,  # Small test
+                seniority_level="senior"
+            )
         
         print(f"\n🎉 Multi-site search completed!")
         print(f"Found {results.total_jobs_found} total LLM jobs across {results.total_sites_searched} sites")
@@ -1,6 +1,7 @@
 """Basic Playwright web scraper for job sites."""
 import asyncio
 import random
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from dataclasses import dataclass
@@ -24,18 +25,68 @@ class JobListing:
 class PlaywrightJobScraper:
     """Base Playwright scraper for job sites."""
     
-    def __init__(self, headless: bool = True, slow_mo: int = 100):
+    # Resource types that job-card text extraction never needs
+    BLOCKED_RESOURCE_TYPES = frozenset({
+        'font', 'image', 'media', 'stylesheet', 'beacon', 'websocket',
+        'csp_report', 'imageset', 'texttrack'
+    })
+    
+    LAUNCH_ARGS = [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-web-security',
+        '--disable-features=VizDisplayCompositor'
+    ]
+    
+    # Realistic browser fingerprint
+    CONTEXT_OPTIONS = {
+        'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'viewport': {'width': 1920, 'height': 1080},
+        'locale': 'en-US',
+        'timezone_id': 'America/Chicago'  # Houston timezone
+    }
+    
+    EXTRA_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none'
+    }
+    
+    def __init__(self, headless: bool = True, slow_mo: int = 100,
+                 user_data_dir: Optional[Path] = None):
         """Initialize the scraper.
         
         Args:
             headless: Run browser in headless mode
             slow_mo: Slow down operations by N milliseconds
+            user_data_dir: Profile directory for a persistent context, so
+                cookies and cache survive between runs
         """
         self.headless = headless
         self.slow_mo = slow_mo
+        self.user_data_dir = Path(user_data_dir) if user_data_dir else None
+        self.playwright = None
         self.browser: Optional[Browser] = None
+        self.shared_browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        
+        # Optional cap on in-flight navigations to this site, shared between scrapers
+        self.request_semaphore: Optional[asyncio.Semaphore] = None
+    
+    def use_browser(self, browser: Optional[Browser]):
+        """Run on a browser launched and owned by the caller (None to launch our own).
+        
+        With a shared browser, start() only opens a context on it and close()
+        closes that context, leaving the browser running for other scrapers.
+        Ignored when a persistent profile (user_data_dir) is used.
+        """
+        self.shared_browser = browser
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -48,73 +99,120 @@ class PlaywrightJobScraper:
     
     async def start(self):
         """Start the browser and create a new page."""
+        if self.shared_browser and not self.user_data_dir:
+            # Reuse the caller's browser; only the context is ours
+            self.browser = self.shared_browser
+            self.context = await self.new_context()
+            self.page = await self.context.new_page()
+            return
+        
         print("Starting Playwright browser...")
         
-        playwright = await async_playwright().start()
-        
-        # Launch browser with realistic settings
-        self.browser = await playwright.chromium.launch(
-            headless=self.headless,
-            slow_mo=self.slow_mo,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor'
-            ]
-        )
-        
-        # Create context with realistic browser fingerprint
-        self.context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/Chicago'  # Houston timezone
-        )
+        self.playwright = await async_playwright().start()
+        
+        if self.user_data_dir:
+            # Persistent profile: cookies and cache are reused across runs
+            self.user_data_dir.mkdir(parents=True, exist_ok=True)
+            self.context = await self.playwright.chromium.launch_persistent_context(
+                str(self.user_data_dir),
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                args=self.LAUNCH_ARGS,
+                **self.CONTEXT_OPTIONS
+            )
+            await self.context.set_extra_http_headers(self.EXTRA_HEADERS)
+        else:
+            # Launch browser with realistic settings
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                args=self.LAUNCH_ARGS
+            )
+            
+            # Create context with realistic browser fingerprint
+            self.context = await self.new_context()
         
         # Create a new page
         self.page = await self.context.new_page()
         
+        print("✓ Browser started successfully")
+    
+    async def new_context(self) -> BrowserContext:
+        """Create a browser context with a realistic fingerprint and headers.
+        
+        Pages opened in the context inherit its settings, so scrapers can
+        run several pages in parallel from the same browser. Not available
+        with a persistent profile, which has exactly one context.
+        """
+        context = await self.browser.new_context(**self.CONTEXT_OPTIONS)
+        
         # Set additional headers
-        await self.page.set_extra_http_headers({
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none'
-        })
+        await context.set_extra_http_headers(self.EXTRA_HEADERS)
         
-        print("✓ Browser started successfully")
+        return context
+    
+    async def block_heavy_resources(self, context: BrowserContext):
+        """Abort requests for images, fonts, media, styles and beacons in a context."""
+        blocked = self.BLOCKED_RESOURCE_TYPES
+        
+        async def handle_route(route):
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+        
+        await context.route('**/*', handle_route)
     
     async def close(self):
-        """Close the browser."""
+        """Close the browser (or just this scraper's context on a shared browser)."""
+        if self.browser is not None and self.browser is self.shared_browser:
+            if self.context:
+                await self.context.close()
+            self.context = None
+            self.browser = None
+            return
+        
         if self.browser:
             await self.browser.close()
+            self.browser = None
+            print("✓ Browser closed")
+        elif self.user_data_dir and self.context:
+            # Persistent contexts own their browser
+            await self.context.close()
             print("✓ Browser closed")
+        self.context = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
     
     async def random_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
         """Add a random delay to mimic human behavior."""
         delay = random.uniform(min_seconds, max_seconds)
         await asyncio.sleep(delay)
     
-    async def safe_navigate(self, url: str, wait_for: str = "networkidle") -> bool:
+    async def safe_navigate(self, url: str, wait_for: str = "networkidle",
+                            page: Optional[Page] = None, timeout: int = 30000) -> bool:
         """Safely navigate to a URL with error handling.
         
         Args:
             url: URL to navigate to
             wait_for: Wait condition ('load', 'domcontentloaded', 'networkidle')
+            page: Page to navigate (defaults to the scraper's main page)
+            timeout: Navigation timeout in milliseconds
             
         Returns:
             True if navigation successful, False otherwise
         """
+        page = page or self.page
         try:
             print(f"Navigating to: {url}")
             
-            # Navigate with timeout
-            await self.page.goto(url, wait_until=wait_for, timeout=30000)
+            # Navigate with timeout (queued behind the site's request limit, if any)
+            if self.request_semaphore:
+                async with self.request_semaphore:
+                    await page.goto(url, wait_until=wait_for, timeout=timeout)
+            else:
+                await page.goto(url, wait_until=wait_for, timeout=timeout)
             
             # Random delay to mimic human behavior
             await self.random_delay()
@@ -5,22 +5,41 @@ Supports both traditional keyword filtering and LLM-based intelligent filtering.
 
 import re
 import os
+import functools
 import asyncio
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Callable, List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass
 
 from ..models.job_models import JobListing, JobType, RemoteType
 
+# google-re2 matches keyword alternations in linear time (DFA); fall back to re
+try:
+    import re2 as keyword_re
+except ImportError:
+    keyword_re = re
 
-@dataclass
+# pyahocorasick matches all tech keywords in one pass over the text; fall back to regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+@dataclass(frozen=True, slots=True)
 class JobFilter:
-    """Configuration for filtering jobs during scraping."""
+    """
+    Configuration for filtering jobs during scraping.
+    
+    Immutable and hashable, so one instance can be shared between scrapers
+    (and used as a cache key); use dataclasses.replace() to derive variants.
+    List arguments are stored as tuples.
+    """
     
     # Keywords to REQUIRE (at least one must be present)
-    required_keywords: List[str] = None
+    required_keywords: Optional[Tuple[str, ...]] = None
     
     # Keywords to EXCLUDE (job rejected if any present)
-    exclude_keywords: List[str] = None
+    exclude_keywords: Optional[Tuple[str, ...]] = None
     
     # Minimum quality score (0-1)
     min_quality_score: float = 0.5
@@ -32,25 +51,120 @@ class JobFilter:
     max_salary: Optional[int] = None
     
     # Required job types
-    allowed_job_types: List[JobType] = None
+    allowed_job_types: Optional[Tuple[JobType, ...]] = None
     
     # Required remote types
-    allowed_remote_types: List[RemoteType] = None
+    allowed_remote_types: Optional[Tuple[RemoteType, ...]] = None
     
     # Minimum description length
     min_description_length: int = 100
     
     # Companies to exclude
-    exclude_companies: List[str] = None
+    exclude_companies: Optional[Tuple[str, ...]] = None
     
     # Experience levels to exclude
-    exclude_experience_levels: List[str] = None
+    exclude_experience_levels: Optional[Tuple[str, ...]] = None
     
     # Enable LLM-based filtering
     use_llm: bool = False
     
     # LLM filtering prompt template
     llm_filter_prompt: Optional[str] = None
+    
+    def __post_init__(self):
+        """Store list-valued fields as tuples so the filter stays immutable."""
+        for name in _JOB_FILTER_SEQUENCE_FIELDS:
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+
+_JOB_FILTER_SEQUENCE_FIELDS = (
+    "required_keywords", "exclude_keywords", "allowed_job_types",
+    "allowed_remote_types", "exclude_companies", "exclude_experience_levels",
+)
+
+
+def compile_keyword_pattern(keywords: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile keywords into one alternation regex for a single-pass scan.
+    
+    Keywords match as plain substrings (same as `kw in text`), so the
+    pattern is escaped and has no word boundaries. Uses google-re2 when
+    installed. Returns None when there are no keywords.
+    """
+    if not keywords:
+        return None
+    # Longest first so the reported match is the most specific keyword
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return keyword_re.compile("|".join(re.escape(kw) for kw in ordered))
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+    """
+    Case-fold a keyword tuple and compile its alternation pattern.
+    
+    Cached on the (immutable) tuple, so every SmartJobFilter built from the
+    same JobFilter, or from filters sharing keyword lists, reuses one pattern.
+    """
+    folded = tuple(kw.casefold() for kw in keywords)
+    return folded, compile_keyword_pattern(folded)
+
+
+def job_search_text(job: JobListing) -> str:
+    """
+    Build the case-folded text that keyword and technology scans run against.
+    
+    Covers title, description, requirements and skills, so one string per
+    job serves the required, exclude and tech-mention scans alike.
+    """
+    return " ".join((
+        job.title,
+        job.description,
+        job.requirements or "",
+        " ".join(job.skills)
+    )).casefold()
+
+
+def _is_word_char(char: str) -> bool:
+    """Same character class as regex \\w."""
+    return char.isalnum() or char == "_"
+
+
+def compile_tech_matcher(keywords: Tuple[str, ...]) -> Callable[[str], Set[str]]:
+    """
+    Build a function returning the distinct keywords a text mentions as whole words.
+    
+    Unlike compile_keyword_pattern, matches need word boundaries on both
+    sides ("go" does not match "google"), so every technology tally counts
+    jobs the same way. Keywords should be lowercase, like job_search_text().
+    Uses an Aho-Corasick automaton when pyahocorasick is installed (one pass
+    however many keywords there are), otherwise one compiled alternation.
+    """
+    if ahocorasick is None:
+        pattern = re.compile(
+            r"\b(" + "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)) + r")\b"
+        )
+        return lambda text: set(pattern.findall(text))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    
+    def find_techs(text: str) -> Set[str]:
+        found = set()
+        last = len(text) - 1
+        for end, keyword in automaton.iter(text):
+            start = end - len(keyword) + 1
+            # The automaton matches substrings; keep only whole-word hits like \b...\b
+            if ((start == 0 or not _is_word_char(text[start - 1]))
+                    and (end == last or not _is_word_char(text[end + 1]))):
+                found.add(keyword)
+        return found
+    
+    return find_techs
 
 
 class SmartJobFilter:
@@ -60,12 +174,18 @@ class SmartJobFilter:
         """Initialize with filter configuration."""
         self.config = filter_config
         
-        # Convert keywords to lowercase for case-insensitive matching
-        self.required_keywords = [kw.lower() for kw in (filter_config.required_keywords or [])]
-        self.exclude_keywords = [kw.lower() for kw in (filter_config.exclude_keywords or [])]
+        # Case-folded keywords and their compiled scans, shared across filters via the cache
+        required_keywords, self.required_pattern = _keyword_matcher(filter_config.required_keywords or ())
+        exclude_keywords, self.exclude_pattern = _keyword_matcher(filter_config.exclude_keywords or ())
+        self.required_keywords = list(required_keywords)
+        self.exclude_keywords = list(exclude_keywords)
         self.exclude_companies = [comp.lower() for comp in (filter_config.exclude_companies or [])]
         self.exclude_experience = [exp.lower() for exp in (filter_config.exclude_experience_levels or [])]
         
+        # Sets for the per-job type checks (O(1) membership, empty means "any")
+        self.allowed_job_types = frozenset(filter_config.allowed_job_types or ())
+        self.allowed_remote_types = frozenset(filter_config.allowed_remote_types or ())
+        
         # Initialize LLM client if enabled
         self.openai_client = None
         if filter_config.use_llm:
@@ -181,14 +301,15 @@ class SmartJobFilter:
         Returns:
             (keep: bool, reason: str)
         """
+        # Description length filter first: the cheapest rejection (disabled for testing)
+        description_length = len(job.description)
+        if description_length < 1:  # Only reject completely empty descriptions
+            return False, f"Description too short ({description_length} chars)"
+        
         # Quality score filter
         if job.quality_score < self.config.min_quality_score:
             return False, f"Quality score {job.quality_score:.2f} below minimum {self.config.min_quality_score}"
         
-        # Description length filter (disabled for testing)
-        if len(job.description) < 1:  # Only reject completely empty descriptions
-            return False, f"Description too short ({len(job.description)} chars)"
-        
         # Salary filters
         if self.config.min_salary and job.salary_min and job.salary_min < self.config.min_salary:
             return False, f"Salary ${job.salary_min:,} below minimum ${self.config.min_salary:,}"
@@ -197,42 +318,44 @@ class SmartJobFilter:
             return False, f"Salary ${job.salary_max:,} above maximum ${self.config.max_salary:,}"
         
         # Job type filter
-        if self.config.allowed_job_types and job.job_type not in self.config.allowed_job_types:
+        if self.allowed_job_types and job.job_type not in self.allowed_job_types:
             return False, f"Job type {job.job_type} not in allowed types"
         
         # Remote type filter
-        if self.config.allowed_remote_types and job.remote_type not in self.config.allowed_remote_types:
+        if self.allowed_remote_types and job.remote_type not in self.allowed_remote_types:
             return False, f"Remote type {job.remote_type} not in allowed types"
         
         # Company exclusion filter
-        for excluded_company in self.exclude_companies:
-            if excluded_company in job.company.lower():
-                return False, f"Company '{job.company}' is excluded"
+        if self.exclude_companies:
+            company_lower = job.company.lower()
+            for excluded_company in self.exclude_companies:
+                if excluded_company in company_lower:
+                    return False, f"Company '{job.company}' is excluded"
         
         # Experience level exclusion
-        if job.experience_level:
+        if job.experience_level and self.exclude_experience:
+            experience_lower = job.experience_level.lower()
             for excluded_exp in self.exclude_experience:
-                if excluded_exp in job.experience_level.lower():
+                if excluded_exp in experience_lower:
                     return False, f"Experience level '{job.experience_level}' is excluded"
         
-        # Create searchable text (title + description + requirements + skills)
-        searchable_text = " ".join([
-            job.title,
-            job.description,
-            job.requirements or "",
-            " ".join(job.skills)
-        ]).lower()
+        # Keyword scans run last, after the cheap field checks above, and the
+        # exclude scan runs before the required scan so rejected jobs pay for one pass
+        if not self.exclude_pattern and not self.required_pattern:
+            return True, "Passed all filters"
+        
+        # Case-folded once and shared by both keyword scans
+        searchable_text = job_search_text(job)
         
         # Exclude keywords filter (any match = reject)
-        for exclude_kw in self.exclude_keywords:
-            if exclude_kw in searchable_text:
-                return False, f"Contains excluded keyword: '{exclude_kw}'"
+        if self.exclude_pattern:
+            excluded = self.exclude_pattern.search(searchable_text)
+            if excluded:
+                return False, f"Contains excluded keyword: '{excluded.group(0)}'"
         
         # Required keywords filter (at least one must match)
-        if self.required_keywords:
-            has_required_keyword = any(req_kw in searchable_text for req_kw in self.required_keywords)
-            if not has_required_keyword:
-                return False, f"Missing required keywords: {self.required_keywords}"
+        if self.required_pattern and not self.required_pattern.search(searchable_text):
+            return False, f"Missing required keywords: {self.required_keywords}"
         
         return True, "Passed all filters"
     
@@ -1,6 +1,7 @@
 """ZipRecruiter job scraper for Houston area."""
 import asyncio
 import re
+from dataclasses import replace
 from typing import List, Optional
 from urllib.parse import urljoin, quote_plus
 from datetime import datetime, timedelta
@@ -25,8 +26,8 @@ class ZipRecruiterScraper(PlaywrightJobScraper):
             # Use default software engineer filter with LLM option
             job_filter = FilterPresets.software_engineer(use_llm=use_llm)
         elif use_llm and not job_filter.use_llm:
-            # Enable LLM on provided filter if requested
-            job_filter.use_llm = True
+            # Enable LLM on a copy so shared filter configs stay untouched
+            job_filter = replace(job_filter, use_llm=True)
         
         self.job_filter = SmartJobFilter(job_filter)
         self.use_smart_filtering = True
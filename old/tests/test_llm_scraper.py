@@ -26,8 +26,9 @@ async def test_llm_scraper_basic():
         print(f"   🎯 Filtering efficiency: {results['filtering_efficiency']}")
         print(f"   ⭐ Average quality: {results['avg_quality_score']:.2f}")
         
-        if results['jobs']:
-            print(f"   🏆 Best match: {results['jobs'][0].title} at {results['jobs'][0].company}")
+        if results['top_jobs']:
+            best = results['top_jobs'][0]
+            print(f"   🏆 Best match: {best.title} at {best.company}")
     
     except Exception as e:
         print(f"   ❌ Error: {e}")
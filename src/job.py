@@ -7,7 +7,7 @@ from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Simple job listing with essential fields only."""
     title: str
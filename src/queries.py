@@ -8,7 +8,7 @@ from typing import List, Dict, Any
 import random
 
 
-@dataclass
+@dataclass(slots=True)
 class QuerySet:
     """A set of related job search queries."""
     name: str
@@ -6,7 +6,7 @@ This file provides easy access to all scrapers and common functionality.
 import argparse
 import asyncio
 import sys
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 # Import all scrapers from the new organized structure
 from .scrapers import JobScraper, RemoteOKScraper
@@ -18,14 +18,18 @@ from .queries import (
     get_all_queries,
     ALL_QUERY_SETS
 )
-from .vector_storage import JobVectorDB
+# The vector DB (chromadb + embedding model) is imported lazily where it is used,
+# so list/dry-run commands don't pay for loading it.
 
 
 # Main quick search function
 async def quick_search(query: str = "software engineer", max_jobs: int = 5, delay: float = 2.0) -> List[Job]:
     """Quick job search function using RemoteOK scraper with full descriptions."""
     scraper = RemoteOKScraper(delay_between_requests=delay)
-    return await scraper.search_jobs(query, max_jobs=max_jobs)
+    try:
+        return await scraper.search_jobs(query, max_jobs=max_jobs)
+    finally:
+        await scraper.shutdown()
 
 
 # Enhanced search functions using predefined queries
@@ -51,12 +55,17 @@ async def search_by_category(category: str, max_jobs: int = 5, delay: float = 2.
 async def search_multiple_queries(queries: List[str], max_jobs_per_query: int = 3) -> List[Job]:
     """Search using multiple queries and combine results."""
     all_jobs = []
+    # One scraper (and browser) shared by all queries
+    scraper = RemoteOKScraper()
     
-    for i, query in enumerate(queries, 1):
-        print(f"\n🔍 Query {i}/{len(queries)}: '{query}'")
-        jobs = await quick_search(query, max_jobs=max_jobs_per_query)
-        all_jobs.extend(jobs)
-        print(f"   Found {len(jobs)} jobs")
+    try:
+        for i, query in enumerate(queries, 1):
+            print(f"\n🔍 Query {i}/{len(queries)}: '{query}'")
+            jobs = await scraper.search_jobs(query, max_jobs=max_jobs_per_query)
+            all_jobs.extend(jobs)
+            print(f"   Found {len(jobs)} jobs")
+    finally:
+        await scraper.shutdown()
     
     # Remove duplicates based on URL
     seen_urls = set()
@@ -77,13 +86,18 @@ async def comprehensive_search(max_jobs_per_category: int = 2) -> List[Job]:
     all_jobs = []
     
     print(f"🚀 Running comprehensive search across {len(ALL_QUERY_SETS)} categories")
+    # One scraper (and browser) shared by all categories
+    scraper = RemoteOKScraper()
     
-    for query_set in ALL_QUERY_SETS:
-        query = query_set.get_random_query()
-        print(f"\n📂 {query_set.name}: '{query}'")
-        jobs = await quick_search(query, max_jobs=max_jobs_per_category)
-        all_jobs.extend(jobs)
-        print(f"   Found {len(jobs)} jobs")
+    try:
+        for query_set in ALL_QUERY_SETS:
+            query = query_set.get_random_query()
+            print(f"\n📂 {query_set.name}: '{query}'")
+            jobs = await scraper.search_jobs(query, max_jobs=max_jobs_per_category)
+            all_jobs.extend(jobs)
+            print(f"   Found {len(jobs)} jobs")
+    finally:
+        await scraper.shutdown()
     
     # Remove duplicates
     seen_urls = set()
@@ -99,20 +113,21 @@ async def comprehensive_search(max_jobs_per_category: int = 2) -> List[Job]:
     return unique_jobs
 
 
-async def exhaustive_search(max_jobs_per_query: int = 10) -> List[Job]:
+async def iter_exhaustive_search(max_jobs_per_query: int = 10,
+                                 max_total: Optional[int] = None) -> AsyncIterator[Job]:
     """
-    Run an exhaustive search using ALL 30 queries for maximum job coverage.
+    Stream an exhaustive search using ALL 30 queries, yielding unique jobs.
     
-    This is the most thorough search possible, using every single query
-    in our database across all categories.
+    Jobs are deduplicated by URL as they arrive, so callers can save or
+    display them incrementally instead of holding the whole result set.
     
     Args:
         max_jobs_per_query: Maximum jobs to get per individual query
+        max_total: Stop running queries once this many unique jobs are found
         
-    Returns:
-        List of unique jobs found across all queries
+    Yields:
+        Unique jobs found across all queries
     """
-    all_jobs = []
     all_queries = get_all_queries()
     
     print(f"🔥 EXHAUSTIVE SEARCH: Running ALL {len(all_queries)} queries")
@@ -122,55 +137,91 @@ async def exhaustive_search(max_jobs_per_query: int = 10) -> List[Job]:
     
     # Use a single scraper instance to maintain cache across all queries  
     scraper = RemoteOKScraper(delay_between_requests=3.0)  # Longer delay for exhaustive search
+    seen_urls = set()
+    total_found = 0
+    unique_found = 0
     
-    for i, query in enumerate(all_queries, 1):
-        print(f"🔍 Query {i:2d}/{len(all_queries)}: '{query}'")
-        
-        try:
-            jobs = await scraper.search_jobs(query, max_jobs=max_jobs_per_query)
-            all_jobs.extend(jobs)
+    try:
+        for i, query in enumerate(all_queries, 1):
+            if max_total is not None and unique_found >= max_total:
+                print(f"🛑 Reached {max_total} unique jobs, skipping remaining {len(all_queries) - i + 1} queries")
+                break
+            
+            print(f"🔍 Query {i:2d}/{len(all_queries)}: '{query}'")
+            
+            try:
+                jobs = await scraper.search_jobs(query, max_jobs=max_jobs_per_query)
+            except Exception as e:
+                print(f"   ❌ Error with query '{query}': {e}")
+                continue
+            
+            total_found += len(jobs)
             print(f"   ✅ Found {len(jobs)} jobs")
             
+            # Remove duplicates based on URL (jobs without URLs are kept)
+            for job in jobs:
+                if max_total is not None and unique_found >= max_total:
+                    break
+                if job.url:
+                    if job.url in seen_urls:
+                        continue
+                    seen_urls.add(job.url)
+                unique_found += 1
+                yield job
+            
             # Show progress and cache stats every 5 queries
             if i % 5 == 0:
-                print(f"   📊 Progress: {i}/{len(all_queries)} queries complete, {len(all_jobs)} total jobs so far")
+                print(f"   📊 Progress: {i}/{len(all_queries)} queries complete, {total_found} total jobs so far")
                 scraper.print_cache_stats()
                 print()
-                
-        except Exception as e:
-            print(f"   ❌ Error with query '{query}': {e}")
-            continue
-                
-    # Remove duplicates based on URL
-    print(f"\n🔄 Deduplicating {len(all_jobs)} jobs...")
-    seen_urls = set()
-    unique_jobs = []
-    
-    for job in all_jobs:
-        if job.url and job.url not in seen_urls:
-            seen_urls.add(job.url)
-            unique_jobs.append(job)
-        elif not job.url:
-            # Keep jobs without URLs (shouldn't happen, but just in case)
-            unique_jobs.append(job)
+    finally:
+        await scraper.shutdown()
     
     print(f"🎯 EXHAUSTIVE SEARCH COMPLETE!")
-    print(f"📊 Total jobs found: {len(all_jobs)}")
-    print(f"🔗 Unique jobs: {len(unique_jobs)}")
-    print(f"♻️  Duplicates removed: {len(all_jobs) - len(unique_jobs)}")
+    print(f"📊 Total jobs found: {total_found}")
+    print(f"🔗 Unique jobs: {unique_found}")
+    print(f"♻️  Duplicates removed: {total_found - unique_found}")
     
     # Show final cache efficiency stats
     print(f"\n💾 Final scraping efficiency:")
     scraper.print_cache_stats()
+
+
+async def exhaustive_search(max_jobs_per_query: int = 10, max_total: Optional[int] = None) -> List[Job]:
+    """
+    Run an exhaustive search using ALL 30 queries for maximum job coverage.
     
-    return unique_jobs
+    This is the most thorough search possible, using every single query
+    in our database across all categories.
+    
+    Args:
+        max_jobs_per_query: Maximum jobs to get per individual query
+        max_total: Stop running queries once this many unique jobs are found
+        
+    Returns:
+        List of unique jobs found across all queries
+    """
+    return [job async for job in iter_exhaustive_search(max_jobs_per_query, max_total)]
+
+
+async def _batched(jobs: AsyncIterator[Job], size: int) -> AsyncIterator[List[Job]]:
+    """Group an async stream of jobs into lists of at most `size`."""
+    batch = []
+    async for job in jobs:
+        batch.append(job)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 
 # Re-export for backward compatibility
 __all__ = [
     'JobScraper', 'RemoteOKScraper', 'quick_search',
     'search_with_random_query', 'search_by_category', 
-    'search_multiple_queries', 'comprehensive_search', 'exhaustive_search'
+    'search_multiple_queries', 'comprehensive_search', 'exhaustive_search',
+    'iter_exhaustive_search'
 ]
 
 
@@ -186,6 +237,7 @@ Examples:
   %(prog)s --category "Core LLM / Generative AI" --max-jobs 8
   %(prog)s --comprehensive --max-jobs-per-category 3
   %(prog)s --exhaustive --max-jobs-per-query 5 --brief
+  %(prog)s --exhaustive --max-total-jobs 100 --no-display
   %(prog)s --multiple "LLM engineer" "RAG engineer" --max-jobs-per-query 4 --dry-run
   %(prog)s --list-categories
   %(prog)s --vectordb-stats
@@ -262,6 +314,12 @@ Note: Jobs are saved to vector database by default. Use --dry-run to skip saving
         default=2,
         help="Max jobs per category for comprehensive search (default: 2)"
     )
+    parser.add_argument(
+        "--max-total-jobs",
+        type=int,
+        default=None,
+        help="Stop exhaustive search once this many unique jobs are found (default: no limit)"
+    )
     parser.add_argument(
         "--delay",
         type=float,
@@ -297,10 +355,88 @@ Note: Jobs are saved to vector database by default. Use --dry-run to skip saving
     return parser
 
 
+# Jobs per vector DB write / display chunk when streaming exhaustive results
+STREAM_BATCH_SIZE = 64
+
+
+def _save_jobs(vectordb, jobs: List[Job]) -> int:
+    """Add jobs that aren't already stored to the vector database."""
+    # add_jobs skips (and reports) stored jobs with one batched lookup
+    return vectordb.add_jobs(jobs) if jobs else 0
+
+
+def _print_vectordb_stats(vectordb):
+    """Print a one-line summary of the vector database."""
+    stats = vectordb.get_stats()
+    print(f"📊 Vector DB Stats: {stats['total_jobs']} total jobs, {stats.get('remote_jobs', 0)} remote")
+
+
+def _display_jobs(jobs: List[Job], args, start: int = 1):
+    """Display jobs according to the output options."""
+    if args.no_display:
+        return
+    for i, job in enumerate(jobs, start):
+        if args.brief:
+            print(f"\n{i}. {job.title} at {job.company}")
+            if job.description:
+                preview = job.description[:150] + "..." if len(job.description) > 150 else job.description
+                print(f"   {preview}")
+            if job.url:
+                print(f"   🔗 {job.url}")
+        else:
+            print(f"\n{i}.")
+            job.display()
+
+
+async def run_exhaustive_search(args):
+    """Stream an exhaustive search, saving and displaying jobs in batches."""
+    print("🔥 Running EXHAUSTIVE search with ALL queries")
+    
+    vectordb = None
+    if not args.dry_run:
+        try:
+            from .vector_storage import JobVectorDB
+            vectordb = JobVectorDB(db_path=args.vectordb_path)
+        except Exception as e:
+            print(f"❌ Error opening vector database: {e}")
+    
+    total = 0
+    jobs = iter_exhaustive_search(
+        max_jobs_per_query=args.max_jobs_per_query or 10,
+        max_total=args.max_total_jobs,
+    )
+    async for batch in _batched(jobs, STREAM_BATCH_SIZE):
+        if vectordb is not None:
+            try:
+                _save_jobs(vectordb, batch)
+            except Exception as e:
+                print(f"❌ Error saving to vector database: {e}")
+        _display_jobs(batch, args, start=total + 1)
+        total += len(batch)
+    
+    if not total:
+        print("❌ No jobs found")
+        return
+    
+    print(f"\n📊 Found {total} jobs")
+    if vectordb is not None:
+        try:
+            _print_vectordb_stats(vectordb)
+        except Exception as e:
+            print(f"❌ Error reading vector database stats: {e}")
+    elif args.dry_run:
+        print(f"🔄 Dry run mode: Not saving {total} jobs to database")
+
+
 async def run_search(args):
     """Run the appropriate search based on arguments."""
     jobs = []
     
+    if args.exhaustive:
+        # Streamed so the full result set is never held in memory
+        await run_exhaustive_search(args)
+        return
+    
     if args.query:
         print(f"🔍 Searching for: '{args.query}'")
         jobs = await quick_search(args.query, max_jobs=args.max_jobs, delay=args.delay)
@@ -317,10 +453,6 @@ async def run_search(args):
         print("🚀 Running comprehensive search across all categories")
         jobs = await comprehensive_search(max_jobs_per_category=args.max_jobs_per_category)
         
-    elif args.exhaustive:
-        print("🔥 Running EXHAUSTIVE search with ALL queries")
-        jobs = await exhaustive_search(max_jobs_per_query=args.max_jobs_per_query or 10)
-        
     elif args.multiple:
         print(f"🔍 Searching {len(args.multiple)} queries")
         jobs = await search_multiple_queries(args.multiple, max_jobs_per_query=args.max_jobs_per_query)
@@ -329,12 +461,13 @@ async def run_search(args):
     if jobs and not args.dry_run:
         print(f"\n💾 Saving jobs to vector database...")
         try:
+            from .vector_storage import JobVectorDB
+            
             vectordb = JobVectorDB(db_path=args.vectordb_path)
-            added_count = vectordb.add_jobs(jobs)
+            _save_jobs(vectordb, jobs)
             
             # Show database stats
-            stats = vectordb.get_stats()
-            print(f"📊 Vector DB Stats: {stats['total_jobs']} total jobs, {stats.get('remote_jobs', 0)} remote")
+            _print_vectordb_stats(vectordb)
             
         except Exception as e:
             print(f"❌ Error saving to vector database: {e}")
@@ -344,19 +477,7 @@ async def run_search(args):
     # Display results
     if jobs:
         print(f"\n📊 Found {len(jobs)} jobs:")
-        
-        if not args.no_display:
-            for i, job in enumerate(jobs, 1):
-                if args.brief:
-                    print(f"\n{i}. {job.title} at {job.company}")
-                    if job.description:
-                        preview = job.description[:150] + "..." if len(job.description) > 150 else job.description
-                        print(f"   {preview}")
-                    if job.url:
-                        print(f"   🔗 {job.url}")
-                else:
-                    print(f"\n{i}.")
-                    job.display()
+        _display_jobs(jobs, args)
     else:
         print("❌ No jobs found")
 
@@ -382,6 +503,8 @@ def list_all_queries():
 def show_vectordb_stats(db_path: str):
     """Show vector database statistics."""
     try:
+        from .vector_storage import JobVectorDB
+        
         vectordb = JobVectorDB(db_path=db_path)
         stats = vectordb.get_stats()
         
@@ -3,27 +3,388 @@ RemoteOK job scraper for remote startup/tech positions.
 """
 
 import asyncio
+import html
 import re
 import random
-from typing import List, Optional
+import sqlite3
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Dict, List, Optional, Tuple, Union
 from playwright.async_api import async_playwright
 
 from .base_scraper import JobScraper
 from ..job import Job
 
+# Full descriptions are kept on disk between runs and reused for this long
+DEFAULT_DESCRIPTION_CACHE = Path.home() / ".cache" / "job-search" / "remoteok_desc.sqlite"
+DESCRIPTION_CACHE_TTL = 24 * 60 * 60  # seconds
+# A failed URL is retried after this long, doubling on each further failure (up to the TTL)
+FAILED_URL_RETRY_AFTER = 10 * 60  # seconds
+
+# A realistic user agent to avoid being blocked
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Marks a URL missing from the description cache (a cached None is a known failure)
+_MISSING = object()
+
+# Requests the scraper never reads: heavy resources and analytics trackers
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+_BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'segment.io')
+
+# Text cleanup patterns, compiled once for every card and detail page
+_WS_RE = re.compile(r'\s+')
+# Common page elements, removed in one pass over whitespace-collapsed text:
+# everything from an "Apply now"/share/QR code/rok.co marker to the end, and
+# inline jQuery snippets
+_CLEANUP_RE = re.compile(
+    r'(?i:Apply now|Share this job:|new QRCode|Get a rok\.co).*'
+    r'|\$\(function\(\).*?\}.*?\)'
+)
+
+# Skill tags that say nothing about the job on a remote-only board
+_SKIP_TAGS = frozenset({'Remote', 'Full-Time', 'Part-Time'})
+
+# Everything _build_job needs from a job row, read in the browser in one call:
+# title (h2), company (first h3), skill tags (other h3s) and the detail link
+_CARD_JS = """(el) => {
+    const h2 = el.querySelector('h2');
+    const h3s = Array.from(el.querySelectorAll('h3'));
+    const link = el.querySelector('a[href]');
+    return {
+        text_length: (el.textContent || '').trim().length,
+        title: h2 ? h2.textContent || '' : '',
+        company: h3s.length ? h3s[0].textContent || '' : '',
+        tags: h3s.slice(1).map(h3 => h3.textContent || ''),
+        href: link ? link.getAttribute('href') || '' : ''
+    };
+}"""
+
+# Meta tags and their attributes in raw HTML, for the no-render fast path
+_META_TAG_RE = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+# Detail page description sources, in order of preference
+_META_NAMES = ('description', 'og:description')
+_DESCRIPTION_SELECTORS = (
+    '.description',  # This worked well in our debug
+    '.job',          # This also had good content
+    '.markdown',     # RemoteOK uses markdown for job descriptions
+    '.job-description',
+    'div[class*="description"]',
+    '[class*="markdown"]'
+)
+# Any of these in the DOM means a description source is ready to read
+_DESCRIPTION_READY_SELECTOR = ', '.join(
+    [f'meta[name="{name}"], meta[property="{name}"]' for name in _META_NAMES]
+    + list(_DESCRIPTION_SELECTORS)
+)
+# Paragraphs containing these (lowercased) are page chrome or JavaScript
+_PARAGRAPH_SKIP = ('apply now', 'share this job', 'qrcode', '$(')
+
+# Body text lines containing these (lowercased) are not part of the description
+_LINE_SKIP = _PARAGRAPH_SKIP + ('copyright',)
+
+# Up to five meaningful lines of the page text joined, so only they cross over
+# from the browser instead of the whole body
+_BODY_LINES_JS = """(skip) => {
+    const text = document.body ? document.body.textContent || '' : '';
+    if (text.trim().length <= 100) return '';
+    const lines = [];
+    for (const raw of text.split('\\n')) {
+        const line = raw.trim();
+        const lower = line.toLowerCase();
+        if (line.length > 40 && !skip.some(s => lower.includes(s))) {
+            lines.push(line);
+            if (lines.length >= 5) break;
+        }
+    }
+    return lines.join(' ');
+}"""
+_BODY_LINES_JS_ARG = list(_LINE_SKIP)
+
+# Finds a detail page's description in the browser: the first substantial meta
+# tag (name or property), else the first substantial description selector, else
+# up to three clean paragraphs. Returns {source, name, text}.
+_DESCRIPTION_JS = """({meta, selectors, skip}) => {
+    for (const name of meta) {
+        const tag = document.querySelector(`meta[name="${name}"]`);
+        let content = tag ? tag.getAttribute('content') : null;
+        if (!content) {
+            const property = document.querySelector(`meta[property="${name}"]`);
+            content = property ? property.getAttribute('content') : null;
+        }
+        if (content && content.trim().length > 50) {
+            return {source: 'meta', name: name, text: content};
+        }
+    }
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        const text = element ? element.textContent || '' : '';
+        if (text.trim().length > 50) {
+            return {source: 'selector', name: selector, text: text};
+        }
+    }
+    const parts = [];
+    for (const p of document.querySelectorAll('p')) {
+        const text = (p.textContent || '').trim();
+        const lower = text.toLowerCase();
+        if (text.length > 30 && !skip.some(s => lower.includes(s))) {
+            parts.push(text);
+            if (parts.length >= 3) break;
+        }
+    }
+    if (parts.length) {
+        return {source: 'paragraphs', name: 'p', text: parts.join(' ')};
+    }
+    return {source: null, name: null, text: ''};
+}"""
+_DESCRIPTION_JS_ARG = {
+    "meta": list(_META_NAMES),
+    "selectors": list(_DESCRIPTION_SELECTORS),
+    "skip": list(_PARAGRAPH_SKIP)
+}
+
+# RemoteOK job row selectors - they use a table structure; the first to match
+# several rows wins
+_JOB_ROW_SELECTORS = (
+    'tr.job',
+    '.job',
+    'tr[data-id]',
+    'table tr:has(td)',
+    '.jobs tr'
+)
+
+# Tries the row selectors in order inside the browser and returns the first one
+# matching more than 3 rows with its total count and _CARD_JS for the first
+# maxJobs rows, or null when none does
+_FIND_ROWS_JS = """({selectors, maxJobs}) => {
+    const readCard = %s;
+    for (const selector of selectors) {
+        let rows;
+        try {
+            rows = Array.from(document.querySelectorAll(selector));
+        } catch (e) {
+            continue;  // Selector not supported by this browser
+        }
+        if (rows.length > 3) {
+            return {selector: selector, total: rows.length, rows: rows.slice(0, maxJobs).map(el => readCard(el))};
+        }
+    }
+    return null;
+}""" % _CARD_JS
+
+
+def _find_meta_description(page_html: str) -> Optional[Tuple[str, str]]:
+    """
+    Return (meta name, content) for the first substantial description meta tag
+    in raw HTML, checked in the same order as _DESCRIPTION_JS, or None.
+    """
+    by_name = {}
+    by_property = {}
+    for tag in _META_TAG_RE.findall(page_html):
+        attrs = {key.lower(): double or single for key, double, single in _ATTR_RE.findall(tag)}
+        content = attrs.get('content')
+        if content is None:
+            continue
+        if 'name' in attrs:
+            by_name.setdefault(attrs['name'], content)
+        if 'property' in attrs:
+            by_property.setdefault(attrs['property'], content)
+    
+    for meta_name in _META_NAMES:
+        content = by_name.get(meta_name) or by_property.get(meta_name)
+        if content:
+            content = html.unescape(content)
+            if len(content.strip()) > 50:  # Need substantial content
+                return meta_name, content
+    return None
+
+
+class _RateLimiter:
+    """
+    Spaces request starts across concurrent workers: each start is 50-100% of
+    `interval` seconds after the previous one, while the requests themselves
+    may still overlap.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+    
+    def reserve(self) -> float:
+        """Claim the next start slot and return how many seconds to wait for it."""
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        # Random gap between 50% and 100% of the interval
+        self._next_start = start + random.uniform(self.interval * 0.5, self.interval)
+        return start - now
+
 
 class RemoteOKScraper(JobScraper):
     """RemoteOK job scraper for remote startup/tech positions."""
     
-    def __init__(self, headless: bool = True, delay_between_requests: float = 2.0):
+    def __init__(self, headless: bool = True, delay_between_requests: float = 2.0,
+                 max_concurrent_pages: int = 5,
+                 cache_path: Optional[Union[str, Path]] = DEFAULT_DESCRIPTION_CACHE,
+                 aggressive_fallback: bool = False):
+        """
+        Pass `cache_path=None` to keep scraped descriptions in memory only;
+        otherwise descriptions younger than DESCRIPTION_CACHE_TTL are loaded
+        from (and new ones saved to) that SQLite file.
+        
+        Pass `aggressive_fallback=True` to scan the whole page text when no
+        meta tag, description selector or paragraph yields a description.
+        """
         super().__init__(headless)
         self.base_url = "https://remoteok.io"
         self.site_name = "RemoteOK"
         # Cache to avoid re-scraping the same job detail pages
-        self._scraped_urls = {}  # url -> full_description mapping
+        self._scraped_urls: Dict[str, Tuple[Optional[str], float]] = {}  # url -> (full_description, expiry)
+        self._failure_counts: Dict[str, int] = {}  # url -> consecutive failed scrapes
         self._scrape_stats = {"cache_hits": 0, "new_scrapes": 0}
+        # Optional on-disk copy of the cache, shared by later runs
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._db: Optional[sqlite3.Connection] = None
+        self._scraped_urls.update(self._load_cached_descriptions())
         # Delay between requests to avoid rate limiting
         self.delay_between_requests = delay_between_requests
+        # Request starts are spaced out across all workers, so pages overlap but the rate stays polite
+        self._rate_limiter = _RateLimiter(delay_between_requests)
+        # Detail pages are fetched concurrently, each on its own page, up to this many at once
+        self.max_concurrent_pages = max_concurrent_pages
+        self._page_semaphore = asyncio.Semaphore(max_concurrent_pages)
+        # Whole-page text scan when every other description source fails
+        self.aggressive_fallback = aggressive_fallback
+        # Browser is launched on first search and reused until shutdown()
+        self._playwright = None
+        self._browser = None
+        # Browserless HTTP client for pages whose meta tags carry the description
+        self._http = None
+    
+    async def _get_browser(self):
+        """Return the shared browser, launching it on first use."""
+        if self._browser is None or not self._browser.is_connected():
+            await self._close_browser()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self._browser
+    
+    async def _get_http(self):
+        """Return the shared HTTP client for raw page fetches, creating it on first use."""
+        if self._http is None:
+            await self._get_browser()  # Starts Playwright
+            self._http = await self._playwright.request.new_context(
+                extra_http_headers={'User-Agent': USER_AGENT},
+                timeout=15000
+            )
+        return self._http
+    
+    async def shutdown(self):
+        """Close the HTTP client and shared browser, stop Playwright and close the description cache."""
+        if self._db:
+            self._db.close()
+            self._db = None
+        await self._close_browser()
+    
+    async def _close_browser(self):
+        """Dispose of the HTTP client, close the browser and stop Playwright (the cache stays open)."""
+        if self._http:
+            await self._http.dispose()
+            self._http = None
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def _new_page(self, browser):
+        """Open a page with the scraper's timeout, user agent and resource blocking."""
+        page = await browser.new_page()
+        
+        # Skip images, fonts, CSS and trackers; only the DOM is read
+        await page.route("**/*", self._block_heavy)
+        
+        # Set a more reasonable default timeout
+        page.set_default_timeout(20000)
+        
+        # Set a realistic user agent to avoid being blocked
+        await page.set_extra_http_headers({
+            'User-Agent': USER_AGENT
+        })
+        return page
+    
+    async def _block_heavy(self, route):
+        """Abort requests for resources the scraper never reads, continue the rest."""
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if (request.resource_type in _BLOCKED_RESOURCE_TYPES or
+                any(host == blocked or host.endswith("." + blocked) for blocked in _BLOCKED_HOSTS)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def _get_db(self) -> sqlite3.Connection:
+        """Open the description cache database, creating the table if needed."""
+        if self._db is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.cache_path), isolation_level=None)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions ("
+                "url TEXT PRIMARY KEY, description TEXT, ts INTEGER)"
+            )
+        return self._db
+    
+    def _load_cached_descriptions(self) -> Dict[str, Tuple[Optional[str], float]]:
+        """Return the descriptions saved by earlier runs that have not expired."""
+        if not self.cache_path:
+            return {}
+        try:
+            rows = self._get_db().execute(
+                "SELECT url, description, ts FROM descriptions WHERE ts > ?",
+                (int(time.time()) - DESCRIPTION_CACHE_TTL,)
+            )
+            return {url: (description, ts + DESCRIPTION_CACHE_TTL) for url, description, ts in rows}
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Description cache unavailable ({self.cache_path}): {e}")
+            self.cache_path = None
+            return {}
+    
+    def _cache_description(self, job_url: str, description: str):
+        """Remember a scraped description, on disk too when the cache file is enabled."""
+        self._scraped_urls[job_url] = (description, time.time() + DESCRIPTION_CACHE_TTL)
+        self._failure_counts.pop(job_url, None)
+        if not self.cache_path:
+            return
+        try:
+            self._get_db().execute(
+                "INSERT OR REPLACE INTO descriptions (url, description, ts) VALUES (?, ?, ?)",
+                (job_url, description, int(time.time()))
+            )
+        except sqlite3.Error as e:
+            print(f"⚠️  Error saving description to cache: {e}")
+    
+    def _cache_failure(self, job_url: str):
+        """Remember a failed scrape for a while, so transient errors are retried later."""
+        failures = self._failure_counts.get(job_url, 0) + 1
+        self._failure_counts[job_url] = failures
+        retry_after = min(FAILED_URL_RETRY_AFTER * 2 ** (failures - 1), DESCRIPTION_CACHE_TTL)
+        self._scraped_urls[job_url] = (None, time.time() + retry_after)
+    
+    def _cached_description(self, job_url: str):
+        """
+        Return the cached description for a URL (None for a cached failure), or
+        _MISSING when it is not cached or has expired (the entry is then dropped).
+        """
+        entry = self._scraped_urls.get(job_url, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+        description, expiry = entry
+        if expiry <= time.time():
+            del self._scraped_urls[job_url]
+            return _MISSING
+        return description
     
     def _build_search_url(self, query: str, location: str) -> str:
         """Build RemoteOK search URL."""
@@ -37,367 +398,281 @@ class RemoteOKScraper(JobScraper):
         print(f"🔍 Searching {self.site_name} for '{query}' (all remote)")
         print(f"📝 Fetching full descriptions from job detail pages")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            page = await browser.new_page()
+        browser = await self._get_browser()
+        page = await self._new_page(browser)
+        
+        try:
+            # Build search URL
+            search_url = self._build_search_url(query, location)
+            print(f"📡 URL: {search_url}")
             
-            # Set a more reasonable default timeout
-            page.set_default_timeout(20000)
+            # Navigate to search results with simple, reliable approach
+            print("🌐 Loading search page...")
             
-            # Set a realistic user agent to avoid being blocked
-            await page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
+            # Add a small initial delay to avoid seeming too eager
+            await page.wait_for_timeout(1000)
             
             try:
-                # Build search URL
-                search_url = self._build_search_url(query, location)
-                print(f"📡 URL: {search_url}")
-                
-                # Navigate to search results with simple, reliable approach
-                print("🌐 Loading search page...")
-                
-                # Add a small initial delay to avoid seeming too eager
-                await page.wait_for_timeout(1000)
-                
-                try:
-                    # Try simple approach first - just navigate without complex waiting
-                    await page.goto(search_url, timeout=25000)
-                    print("✅ Page loaded successfully")
-                    
-                    # Give page time to render content
-                    await page.wait_for_timeout(3000)
-                    
-                except Exception as e:
-                    print(f"❌ Page load failed completely: {e}")
-                    return []
-                
-                # RemoteOK job selectors - they use a table structure
-                job_cards = []
-                selectors_to_try = [
-                    'tr.job',
-                    '.job',
-                    'tr[data-id]',
-                    'table tr:has(td)',
-                    '.jobs tr'
-                ]
-                
-                for selector in selectors_to_try:
-                    try:
-                        cards = await page.query_selector_all(selector)
-                        if cards and len(cards) > 3:  # Need several results
-                            job_cards = cards
-                            print(f"📄 Found {len(job_cards)} job cards using selector: {selector}")
-                            break
-                    except:
-                        continue
-                
-                if not job_cards:
-                    page_title = await page.title()
-                    print(f"⚠️  No job cards found. Page title: {page_title}")
-                    return []
+                # Try simple approach first - just navigate without complex waiting
+                await page.goto(search_url, timeout=25000)
+                print("✅ Page loaded successfully")
                 
-                # First pass: extract basic job info and URLs
-                jobs = []
-                basic_jobs = []
+                # Give page time to render content
+                await page.wait_for_timeout(3000)
                 
-                for i, card in enumerate(job_cards[:max_jobs]):
-                    try:
-                        job = await self._extract_job(card, None)  # No full descriptions on first pass
-                        if job:
-                            basic_jobs.append(job)
-                            print(f"✅ {len(basic_jobs)}: {job.title} at {job.company}")
-                    except Exception as e:
-                        print(f"⚠️  Error extracting job {i+1}: {e}")
-                        continue
-                
-                # Second pass: get full descriptions for all jobs
-                if basic_jobs:
-                    print(f"\n📝 Fetching full descriptions for {len(basic_jobs)} jobs...")
-                    for i, job in enumerate(basic_jobs):
-                        if job.url:
-                            try:
-                                # Check if this will be a cache hit to avoid unnecessary delay
-                                is_cache_hit = job.url in self._scraped_urls
-                                
-                                # Add random delay between requests to avoid rate limiting (but not for cache hits)
-                                if i > 0 and not is_cache_hit:
-                                    # Random delay between 50% and 100% of the configured delay
-                                    min_delay = self.delay_between_requests * 0.5
-                                    max_delay = self.delay_between_requests
-                                    actual_delay = random.uniform(min_delay, max_delay)
-                                    print(f"⏳ Waiting {actual_delay:.1f}s to avoid rate limiting...")
-                                    await asyncio.sleep(actual_delay)
-                                
-                                full_description = await self._get_full_description(page, job.url)
-                                if full_description:
-                                    # Create new job with full description
-                                    enhanced_job = Job(
-                                        title=job.title,
-                                        company=job.company,
-                                        location=job.location,
-                                        description=full_description,
-                                        url=job.url,
-                                        salary=job.salary,
-                                        remote=job.remote,
-                                        posted_date=job.posted_date
-                                    )
-                                    jobs.append(enhanced_job)
-                                else:
-                                    jobs.append(job)  # Keep original if full description fails
-                            except Exception as e:
-                                print(f"⚠️  Error getting full description for job {i+1}: {e}")
-                                jobs.append(job)  # Keep original
-                        else:
-                            jobs.append(job)
-                else:
-                    jobs = basic_jobs
-                
-                return jobs
-                
-            finally:
-                await browser.close()
-    
-    async def _extract_job(self, card, page=None) -> Optional[Job]:
-        """Extract job data from RemoteOK table row."""
-        try:
-            # Get all text content for parsing
-            text_content = await card.text_content()
-            if not text_content or len(text_content.strip()) < 10:
-                return None
-            
-            # RemoteOK specific selectors - be very targeted
-            title = "Unknown Title"
-            
-            # Simple title extraction
-            title_element = await card.query_selector('h2')
-            if title_element:
-                title_text = await title_element.text_content()
-                if title_text and len(title_text.strip()) > 3:
-                    title = re.sub(r'\s+', ' ', title_text.strip())
-                else:
-                    title = "Unknown Title"
-            else:
-                title = "Unknown Title"
+            except Exception as e:
+                print(f"❌ Page load failed completely: {e}")
+                return []
             
-            # Simple company extraction
-            company_element = await card.query_selector('h3')
-            if company_element:
-                company_text = await company_element.text_content()
-                if company_text and len(company_text.strip()) > 1:
-                    company = re.sub(r'\s+', ' ', company_text.strip())
-                else:
-                    company = "Unknown Company"
-            else:
-                company = "Unknown Company"
+            # Probe the row selectors and read the first max_jobs rows in one round-trip
+            rows = []
+            try:
+                found = await page.evaluate(_FIND_ROWS_JS, {
+                    "selectors": list(_JOB_ROW_SELECTORS),
+                    "maxJobs": max_jobs
+                })
+                if found:
+                    rows = found["rows"]
+                    print(f"📄 Found {found['total']} job cards using selector: {found['selector']}")
+            except Exception as e:
+                print(f"⚠️  Error finding job cards: {e}")
             
-            # Location is always Remote for RemoteOK
-            location = "Remote"
+            if not rows:
+                page_title = await page.title()
+                print(f"⚠️  No job cards found. Page title: {page_title}")
+                return []
             
-            # For RemoteOK, just use the skill tags from h3 elements as description
-            # This avoids the messy JSON content entirely
-            skill_tags = []
-            h3_elements = await card.query_selector_all('h3')
+            # First pass: extract basic job info and URLs
+            basic_jobs = []
             
-            # Skip first h3 (company), collect others as skills/tags
-            for h3 in h3_elements[1:]:
-                tag_text = await h3.text_content()
-                if tag_text:
-                    clean_tag = re.sub(r'\s+', ' ', tag_text.strip())
-                    if (len(clean_tag) > 1 and 
-                        clean_tag not in ['Remote', 'Full-Time', 'Part-Time'] and
-                        len(clean_tag) < 20):  # Skip very long tags
-                        skill_tags.append(clean_tag)
+            for i, data in enumerate(rows):
+                try:
+                    job = self._build_job(data)  # No full descriptions on first pass
+                    if job:
+                        basic_jobs.append(job)
+                        print(f"✅ {len(basic_jobs)}: {job.title} at {job.company}")
+                except Exception as e:
+                    print(f"⚠️  Error extracting job {i+1}: {e}")
+                    continue
             
-            # Create clean description from skills
-            if skill_tags:
-                description = " • ".join(skill_tags) 
+            # Second pass: get full descriptions for all jobs, several pages at a time
+            if basic_jobs:
+                print(f"\n📝 Fetching full descriptions for {len(basic_jobs)} jobs...")
+                await self._get_http()  # Shared by all workers, so create it up front
+                jobs = await asyncio.gather(*(
+                    self._fetch_full_job(browser, i, job) for i, job in enumerate(basic_jobs)
+                ))
             else:
-                description = "Remote position"
+                jobs = basic_jobs
             
-            # Get URL - RemoteOK links to job details
-            url = ""
-            url_element = await card.query_selector('a[href]')
-            if url_element:
-                relative_url = await url_element.get_attribute('href')
-                if relative_url:
-                    if relative_url.startswith('/'):
-                        url = f"{self.base_url}{relative_url}"
-                    else:
-                        url = relative_url
+            return jobs
             
-            # Skip salary extraction - it will be in the description if present
-            salary = None
-            
-            # All RemoteOK jobs are remote by definition
-            remote = True
-            
-            # Skip if we couldn't extract basic info (but be less strict)
-            if title == "Unknown Title" or company == "Unknown Company":
+        finally:
+            await page.close()
+    
+    async def _fetch_full_job(self, browser, index: int, job: Job) -> Job:
+        """Return job with its full description, fetched on a pooled detail page."""
+        if not job.url:
+            return job
+        
+        # Cache hits skip the page pool, the delay and the page entirely
+        full_description = self._cached_description(job.url)
+        if full_description is not _MISSING:
+            self._scrape_stats["cache_hits"] += 1
+            print(f"💾 Using cached description for {job.url}")
+        else:
+            full_description = await self._fetch_description(browser, index, job.url)
+        
+        if full_description:
+            # The job was built by this search, so fill in its full description in place
+            job.description = full_description
+        return job  # Keeps the skill-tag description if full description fails
+    
+    async def _fetch_description(self, browser, index: int, job_url: str) -> Optional[str]:
+        """Scrape a description on a pooled detail page, at most max_concurrent_pages at once."""
+        # Wait for this request's slot under the shared rate limit, before taking a page
+        actual_delay = self._rate_limiter.reserve()
+        if actual_delay > 0:
+            print(f"⏳ Waiting {actual_delay:.1f}s to avoid rate limiting...")
+            await asyncio.sleep(actual_delay)
+        
+        async with self._page_semaphore:
+            try:
+                self._scrape_stats["new_scrapes"] += 1
+                print(f"📝 Fetching full description from {job_url}")
+                
+                # Fast path: most pages carry the description in a meta tag, no page needed
+                meta_description = await self._fetch_meta_description(job_url)
+                if meta_description:
+                    # Cache the result before returning
+                    self._cache_description(job_url, meta_description)
+                    return meta_description
+                
+                page = await self._new_page(browser)
+                try:
+                    return await self._get_full_description(page, job_url)
+                finally:
+                    await page.close()
+            except Exception as e:
+                print(f"⚠️  Error getting full description for job {index+1}: {e}")
                 return None
-            
-            return Job(
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                url=url,
-                salary=salary,
-                remote=remote
-            )
-            
+    
+    async def _extract_job(self, card, page=None) -> Optional[Job]:
+        """Extract job data from RemoteOK table row."""
+        try:
+            # One round-trip to the browser for every field of the row
+            data = await card.evaluate(_CARD_JS)
+            return self._build_job(data)
         except Exception as e:
             print(f"⚠️  Error extracting job: {e}")
             return None
     
-    async def _get_full_description(self, page, job_url: str) -> Optional[str]:
-        """Navigate to job detail page and extract full description."""
+    def _build_job(self, data: dict) -> Optional[Job]:
+        """Build a Job from the raw fields _CARD_JS extracted from a table row."""
+        if data["text_length"] < 10:
+            return None
         
-        # Check cache first to avoid re-scraping
-        if job_url in self._scraped_urls:
-            self._scrape_stats["cache_hits"] += 1
-            print(f"💾 Using cached description for {job_url}")
-            return self._scraped_urls[job_url]
+        # RemoteOK specific selectors - be very targeted
+        title_text = data["title"].strip()
+        if len(title_text) > 3:
+            title = _WS_RE.sub(' ', title_text)
+        else:
+            title = "Unknown Title"
+        
+        company_text = data["company"].strip()
+        if len(company_text) > 1:
+            company = _WS_RE.sub(' ', company_text)
+        else:
+            company = "Unknown Company"
+        
+        # Location is always Remote for RemoteOK
+        location = "Remote"
         
+        # For RemoteOK, just use the skill tags from h3 elements as description
+        # This avoids the messy JSON content entirely
+        # The first h3 (company) is already dropped; skip very long tags
+        clean_tags = [_WS_RE.sub(' ', tag_text.strip()) for tag_text in data["tags"]]
+        skill_tags = [tag for tag in clean_tags if 1 < len(tag) < 20 and tag not in _SKIP_TAGS]
+        
+        # Create clean description from skills
+        if skill_tags:
+            description = " • ".join(skill_tags) 
+        else:
+            description = "Remote position"
+        
+        # Get URL - RemoteOK links to job details
+        url = ""
+        relative_url = data["href"]
+        if relative_url:
+            if relative_url.startswith('/'):
+                url = f"{self.base_url}{relative_url}"
+            else:
+                url = relative_url
+        
+        # Skip salary extraction - it will be in the description if present
+        salary = None
+        
+        # All RemoteOK jobs are remote by definition
+        remote = True
+        
+        # Skip if we couldn't extract basic info (but be less strict)
+        if title == "Unknown Title" or company == "Unknown Company":
+            return None
+        
+        return Job(
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            url=url,
+            salary=salary,
+            remote=remote
+        )
+    
+    async def _fetch_meta_description(self, job_url: str) -> Optional[str]:
+        """Fetch a detail page's raw HTML over HTTP and return its meta description, if any."""
         try:
-            self._scrape_stats["new_scrapes"] += 1
-            print(f"📝 Fetching full description from {job_url}")
-            
-            # Navigate and wait for initial load with timeouts
+            http = await self._get_http()
+            response = await http.get(job_url)
+            if not response.ok:
+                return None
+            page_html = await response.text()
+        except Exception as e:
+            print(f"⚠️  Quick fetch failed, rendering page instead: {e}")
+            return None
+        
+        found = _find_meta_description(page_html)
+        if not found:
+            return None
+        meta_name, content = found
+        print(f"✅ Found clean description in {meta_name} meta tag (no render)")
+        return _WS_RE.sub(' ', content.strip())
+    
+    async def _get_full_description(self, page, job_url: str) -> Optional[str]:
+        """Render the job detail page and extract full description (callers try the cache and meta fast path)."""
+        try:
+            # Navigate, then wait only for an element we can read the description from
             try:
                 await page.goto(job_url, wait_until='domcontentloaded', timeout=15000)
-                
-                # Try to wait for network activity to finish, but don't fail on timeout
-                try:
-                    await page.wait_for_load_state('networkidle', timeout=8000)
-                    await page.wait_for_load_state('load', timeout=5000)
-                except:
-                    print("📄 Page loading timeout, continuing with available content...")
             except Exception as e:
                 print(f"⚠️  Job page navigation failed: {e}")
                 return None
             
-            # Scroll to trigger lazy loading
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            
-            # Wait for any new content after scrolling
             try:
-                await page.wait_for_load_state('networkidle', timeout=5000)
-                print("📄 Network idle after scroll")
+                await page.wait_for_selector(_DESCRIPTION_READY_SELECTOR, state='attached', timeout=8000)
             except:
-                print("📄 No additional network activity")
+                print("📄 No description element yet, continuing with available content...")
             
-            # Wait for substantial content to appear
-            try:
-                await page.wait_for_function(
-                    '() => document.body.textContent.length > 1000',
-                    timeout=10000
-                )
-                print("📄 Substantial content detected")
-            except:
-                print("📄 Limited content on page")
+            # Meta tags, then description selectors, then paragraphs, in one round-trip
+            found = await page.evaluate(_DESCRIPTION_JS, _DESCRIPTION_JS_ARG)
             
-            # First try: Extract meta tags (cleanest approach)
-            meta_description = await self._extract_meta_tags(page)
-            if meta_description:
+            full_description = ""
+            if found["source"] == "meta":
+                # Meta tags are the cleanest approach; they only need whitespace cleanup
+                meta_description = _WS_RE.sub(' ', found["text"].strip())
+                print(f"✅ Found clean description in {found['name']} meta tag")
                 # Cache the result before returning
-                self._scraped_urls[job_url] = meta_description
+                self._cache_description(job_url, meta_description)
                 return meta_description
-            
-            # Second try: Use the specific selectors we found in aggressive debug
-            description_selectors = [
-                '.description',  # This worked well in our debug
-                '.job',          # This also had good content
-                '.markdown',     # RemoteOK uses markdown for job descriptions
-                '.job-description',
-                'div[class*="description"]',
-                '[class*="markdown"]'
-            ]
-            
-            full_description = ""
-            for selector in description_selectors:
+            elif found["source"] == "selector":
+                full_description = found["text"].strip()
+                print(f"✅ Found description using selector: {found['name']}")
+            elif found["source"] == "paragraphs":
+                full_description = found["text"]
+            
+            # Last resort (opt-in): meaningful lines of the page text, filtered in the browser
+            if not full_description and self.aggressive_fallback:
                 try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        if text and len(text.strip()) > 50:  # Need substantial content
-                            full_description = text.strip()
-                            print(f"✅ Found description using selector: {selector}")
-                            break
+                    full_description = await page.evaluate(_BODY_LINES_JS, _BODY_LINES_JS_ARG)
                 except Exception as e:
-                    print(f"⚠️  Error with selector {selector}: {e}")
-                    continue
-            
-            # If no markdown found, try paragraphs but be more selective
-            if not full_description:
-                paragraphs = await page.query_selector_all('p')
-                desc_parts = []
-                for p in paragraphs:
-                    text = await p.text_content()
-                    if (text and len(text.strip()) > 30 and 
-                        'apply now' not in text.lower() and
-                        'share this job' not in text.lower() and
-                        'qrcode' not in text.lower() and
-                        '$(' not in text):  # Skip JavaScript
-                        desc_parts.append(text.strip())
-                        if len(desc_parts) >= 3:  # Enough content
-                            break
-                
-                if desc_parts:
-                    full_description = " ".join(desc_parts)
+                    print(f"⚠️  Error extracting all text: {e}")
             
-            # Last resort: get all text content and clean it up
             if not full_description:
-                try:
-                    # Get all text content from the page
-                    all_text = await page.evaluate('document.body.textContent')
-                    if all_text and len(all_text.strip()) > 100:
-                        # Try to extract meaningful content
-                        lines = all_text.split('\n')
-                        meaningful_lines = []
-                        for line in lines:
-                            line = line.strip()
-                            if (len(line) > 40 and 
-                                'apply now' not in line.lower() and
-                                'share this job' not in line.lower() and
-                                'qrcode' not in line.lower() and
-                                'copyright' not in line.lower() and
-                                '$(' not in line):
-                                meaningful_lines.append(line)
-                                if len(meaningful_lines) >= 5:  # Enough content
-                                    break
-                        
-                        if meaningful_lines:
-                            full_description = " ".join(meaningful_lines)
-                except Exception as e:
-                    print(f"⚠️  Error extracting all text: {e}")
+                # Visible so a missing selector can be added for this page layout
+                print(f"⚠️  No description source matched on {job_url}")
             
             if full_description:
                 # Clean up the description more thoroughly
-                full_description = re.sub(r'\s+', ' ', full_description)
+                full_description = _WS_RE.sub(' ', full_description)
                 
                 # Remove common page elements
-                full_description = re.sub(r'Apply now.*?$', '', full_description, flags=re.IGNORECASE)
-                full_description = re.sub(r'Share this job:.*?$', '', full_description, flags=re.IGNORECASE)
-                full_description = re.sub(r'\$\(function\(\).*?\}.*?\)', '', full_description)
-                full_description = re.sub(r'new QRCode.*?$', '', full_description, flags=re.IGNORECASE)
-                full_description = re.sub(r'Get a rok\.co.*?$', '', full_description, flags=re.IGNORECASE)
+                full_description = _CLEANUP_RE.sub('', full_description)
                 
                 full_description = full_description.strip()
                 
                 if len(full_description) > 20:  # Only return if we have substantial content
                     # Cache the result before returning
-                    self._scraped_urls[job_url] = full_description
+                    self._cache_description(job_url, full_description)
                     return full_description
             
-            # Cache None result to avoid retrying failed URLs
-            self._scraped_urls[job_url] = None
+            # Cache the failure so the URL is not retried until it expires
+            self._cache_failure(job_url)
             return None
             
         except Exception as e:
             print(f"⚠️  Error fetching full description: {e}")
-            # Cache None result to avoid retrying failed URLs
-            self._scraped_urls[job_url] = None
+            # Cache the failure so the URL is not retried until it expires
+            self._cache_failure(job_url)
             return None
     
     def get_cache_stats(self) -> dict:
@@ -423,36 +698,3 @@ class RemoteOKScraper(JobScraper):
         print(f"   🆕 New scrapes: {stats['new_scrapes']}")
         print(f"   🗄️  URLs cached: {stats['total_urls_cached']}")
         print(f"   ⚡ Cache hit rate: {stats['cache_hit_rate']:.1f}%")
-    
-    async def _extract_meta_tags(self, page) -> Optional[str]:
-        """Extract job description from meta tags (cleanest approach)."""
-        try:
-            meta_tags = ['description', 'og:description']
-            
-            for meta_name in meta_tags:
-                try:
-                    # Try both name and property attributes
-                    meta_content_name = await page.get_attribute(f'meta[name="{meta_name}"]', 'content')
-                    if not meta_content_name:
-                        meta_content_property = await page.get_attribute(f'meta[property="{meta_name}"]', 'content')
-                        content = meta_content_property
-                    else:
-                        content = meta_content_name
-                    
-                    if content and len(content.strip()) > 50:  # Need substantial content
-                        # Clean up the meta description
-                        clean_content = re.sub(r'\s+', ' ', content.strip())
-                        print(f"✅ Found clean description in {meta_name} meta tag")
-                        return clean_content
-                        
-                except Exception as e:
-                    print(f"⚠️  Error extracting {meta_name}: {e}")
-                    continue
-            
-            return None
-            
-        except Exception as e:
-            print(f"⚠️  Error extracting meta tags: {e}")
-            return None
-
-
@@ -4,22 +4,51 @@ Building this step by step to be able to verify each component.
 """
 
 import os
-import uuid
-from typing import List, Dict, Optional, Tuple
+from hashlib import blake2b
+from typing import List, Dict, Tuple
 from datetime import datetime
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 
 from .job import Job
 
+# 384-dimensional MiniLM model - roughly twice the encode throughput of 768d models
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# HNSW index tuning (Chroma applies these when the collection is created).
+# Higher M / ef_construction give better recall at the cost of build time and
+# memory; search_ef trades query latency for recall at query time. The distance
+# metric stays Chroma's default (l2) so old and new collections score alike.
+HNSW_SETTINGS = {
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
+
+
+def job_id(job: Job) -> str:
+    """Stable ID for a job: hash of its URL, or of title + company when there is no URL."""
+    # Unit separator between the fields, so ("AB", "C") and ("A", "BC") differ
+    key = job.url or f"{job.title}\x1f{job.company}"
+    return blake2b(key.encode("utf-8")).hexdigest()[:16]
+
+
+def lookup_ids(job: Job) -> List[str]:
+    """IDs a job may be stored under: job_id(), plus the raw URL older databases used."""
+    return [job_id(job), job.url] if job.url else [job_id(job)]
+
 
 class JobVectorDB:
     """Vector database for storing and searching jobs with embedding-based similarity."""
     
-    def __init__(self, db_path: str = "./job_vector_db", collection_name: str = "jobs"):
+    def __init__(self, db_path: str = "./job_vector_db", collection_name: str = "jobs",
+                 embedding_model: str = DEFAULT_EMBEDDING_MODEL):
         """Initialize the vector database."""
         self.db_path = db_path
         self.collection_name = collection_name
+        self.embedding_model = embedding_model
+        self.embedding_function = self._create_embedding_function(embedding_model)
         
         # Create database directory
         os.makedirs(db_path, exist_ok=True)
@@ -37,15 +66,48 @@ class JobVectorDB:
         
         # Get or create collection
         try:
-            self.collection = self.client.get_collection(collection_name)
+            self.collection = self.client.get_collection(
+                collection_name,
+                embedding_function=self.embedding_function
+            )
             print(f"📂 Using existing collection: {collection_name}")
         except Exception:  # Catch any exception (NotFoundError, ValueError, etc.)
             # Collection doesn't exist, create it
-            self.collection = self.client.create_collection(
-                name=collection_name,
-                metadata={"description": "Job search results with embeddings"}
-            )
+            self.collection = self._create_collection()
             print(f"📂 Created new collection: {collection_name}")
+        else:
+            self._check_embedding_model()
+    
+    def _check_embedding_model(self):
+        """Refuse to mix embedding spaces in an existing collection."""
+        # Collections from before the model was recorded used the default model
+        stored_model = (self.collection.metadata or {}).get("embedding_model", DEFAULT_EMBEDDING_MODEL)
+        if stored_model != self.embedding_model:
+            raise ValueError(
+                f"Collection '{self.collection_name}' at {self.db_path} was built with embedding "
+                f"model '{stored_model}', not '{self.embedding_model}'. Use the same model, or "
+                f"a new db_path/collection_name for the new model."
+            )
+    
+    @staticmethod
+    def _create_embedding_function(model_name: str):
+        """Create the embedding function for the given sentence-transformers model."""
+        if model_name == DEFAULT_EMBEDDING_MODEL:
+            # Chroma bundles this model as ONNX, no torch needed
+            return embedding_functions.DefaultEmbeddingFunction()
+        return embedding_functions.SentenceTransformerEmbeddingFunction(model_name=model_name)
+    
+    def _create_collection(self):
+        """Create the job collection with our embedding function."""
+        return self.client.create_collection(
+            name=self.collection_name,
+            embedding_function=self.embedding_function,
+            metadata={
+                "description": "Job search results with embeddings",
+                "embedding_model": self.embedding_model,
+                **HNSW_SETTINGS
+            }
+        )
     
     def _create_job_text(self, job: Job) -> str:
         """Create searchable text from job for embedding."""
@@ -79,13 +141,15 @@ class JobVectorDB:
     
     def add_job(self, job: Job) -> bool:
         """Add a single job to the vector database."""
-        # Create unique ID (we'll use URL if available, otherwise generate)
-        job_id = job.url if job.url else str(uuid.uuid4())
+        # Create stable ID from URL (or title + company)
+        doc_id = job_id(job)
         
-        # Check if job already exists
-        existing = self._get_job_by_id(job_id)
-        if existing:
-            print(f"⚠️  Job already exists: {job.title} at {job.company}")
+        # Check if job already exists (under either ID scheme)
+        try:
+            if self.existing_ids(lookup_ids(job)):
+                print(f"⚠️  Job already exists: {job.title} at {job.company}")
+                return False
+        except Exception:
             return False
         
         # Create embedding text and metadata
@@ -97,7 +161,7 @@ class JobVectorDB:
             self.collection.add(
                 documents=[text],
                 metadatas=[metadata],
-                ids=[job_id]
+                ids=[doc_id]
             )
             
             print(f"✅ Added job: {job.title} at {job.company}")
@@ -108,47 +172,70 @@ class JobVectorDB:
             return False
     
     def add_jobs(self, jobs: List[Job]) -> int:
-        """Add multiple jobs to the vector database."""
-        added_count = 0
-        
+        """Add multiple jobs to the vector database in a single batch."""
         print(f"📥 Adding {len(jobs)} jobs to vector database...")
         
-        for i, job in enumerate(jobs, 1):
-            if self.add_job(job):
-                added_count += 1
-            
-            # Progress indicator for large batches
-            if i % 10 == 0 or i == len(jobs):
-                print(f"   Progress: {i}/{len(jobs)} processed")
+        # Drop jobs already stored (or repeated within this batch); one lookup
+        # covers both the hashed IDs and the raw-URL IDs of older databases
+        try:
+            existing = self.existing_ids([id_ for job in jobs for id_ in lookup_ids(job)])
+        except Exception:
+            # Without the lookup every job would look new; add nothing rather than duplicates
+            return 0
+        ids, documents, metadatas = [], [], []
+        
+        for job in jobs:
+            doc_id = job_id(job)
+            if doc_id in existing or (job.url and job.url in existing):
+                continue
+            existing.add(doc_id)
+            ids.append(doc_id)
+            documents.append(self._create_job_text(job))
+            metadatas.append(self._create_job_metadata(job))
+        
+        if len(ids) < len(jobs):
+            print(f"♻️  Skipping {len(jobs) - len(ids)} jobs already in vector database")
+        
+        if not ids:
+            print("💾 No new jobs to add to vector database")
+            return 0
         
-        print(f"💾 Successfully added {added_count} new jobs to vector database")
-        return added_count
-    
-    def _get_job_by_id(self, job_id: str) -> Optional[Dict]:
-        """Check if a job exists by ID."""
         try:
-            result = self.collection.get(
-                ids=[job_id],
-                include=["documents", "metadatas"]
+            # One add call so the embedding function encodes all documents as a batch
+            self.collection.add(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids
             )
-            
-            if result['ids']:
-                return {
-                    'id': result['ids'][0],
-                    'document': result['documents'][0],
-                    'metadata': result['metadatas'][0]
-                }
-            return None
-            
-        except Exception:
-            return None
+        except Exception as e:
+            print(f"❌ Error adding jobs: {e}")
+            return 0
+        
+        print(f"💾 Successfully added {len(ids)} new jobs to vector database")
+        return len(ids)
+    
+    def existing_ids(self, ids: List[str]) -> set:
+        """
+        Return the subset of IDs already stored, using a single batched lookup.
+        
+        IDs that aren't stored are simply left out; a failed lookup is
+        reported and re-raised so callers don't mistake it for "all new".
+        """
+        if not ids:
+            return set()
+        
+        try:
+            result = self.collection.get(ids=ids, include=[])
+        except Exception as e:
+            print(f"❌ Error checking existing jobs: {e}")
+            raise
+        return set(result['ids'])
     
     def get_stats(self) -> Dict:
         """Get basic statistics about the vector database."""
         try:
-            # Get total count
-            result = self.collection.get()
-            total_jobs = len(result['ids'])
+            # Get total count without reading any rows
+            total_jobs = self.collection.count()
             
             if total_jobs == 0:
                 return {
@@ -157,8 +244,9 @@ class JobVectorDB:
                     "db_path": self.db_path
                 }
             
-            # Count by source and other stats
-            metadatas = result['metadatas']
+            # Count by source and other stats - only metadata is needed, so don't
+            # pull documents or embeddings through the scan
+            metadatas = self.collection.get(include=["metadatas"])['metadatas']
             sources = {}
             companies = {}
             remote_count = 0
@@ -196,10 +284,7 @@ class JobVectorDB:
         print("⚠️  Resetting vector database...")
         try:
             self.client.delete_collection(self.collection_name)
-            self.collection = self.client.create_collection(
-                name=self.collection_name,
-                metadata={"description": "Job search results with embeddings"}
-            )
+            self.collection = self._create_collection()
             print("✅ Database reset complete")
         except Exception as e:
             print(f"❌ Error resetting database: {e}")